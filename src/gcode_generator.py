@@ -35,7 +35,7 @@ from .utils.subroutine_generator import (
 )
 from .utils.validators import validate_arc_geometry
 from .utils.lead_in import (
-    _user_angle_to_math_angle,
+    _approach_unit_vector,
     calculate_lead_in_distance,
     calculate_circle_lead_in_point,
     calculate_hexagon_lead_in_point,
@@ -51,7 +51,7 @@ from .utils.corner_detection import generate_corner_slowdown_points
 from .utils.safety import create_safety_coordinator, FeedContext
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class GenerationSettings:
     """Settings needed for G-code generation."""
     safety_height: float
@@ -76,7 +76,7 @@ class GenerationSettings:
     arc_feed_factor: float = 0.8  # Reduce feed to 80% on arcs
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolParams:
     """Tool-specific cutting parameters."""
     spindle_speed: int
@@ -87,7 +87,7 @@ class ToolParams:
     tool_diameter: float = 0.125
 
 
-@dataclass
+@dataclass(slots=True)
 class GenerationResult:
     """Result of G-code generation."""
     main_gcode: str
@@ -96,7 +96,7 @@ class GenerationResult:
     warnings: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class PathMove:
     """A single move in a cutting path."""
     x: float
@@ -291,7 +291,7 @@ class WebGCodeGenerator:
                 if lead_in.profile_transition == 'arc' and lead_in.profile_transition_target:
                     target_x, target_y = lead_in.profile_transition_target
                     cx, cy = lead_in.helix_center
-                    cut_radius = math.sqrt((target_x - cx) ** 2 + (target_y - cy) ** 2)
+                    cut_radius = math.hypot(target_x - cx, target_y - cy)
                     transition = 'arc'
                 elif lead_in.profile_transition == 'linear' and lead_in.profile_transition_target:
                     target_point = lead_in.profile_transition_target
@@ -325,21 +325,19 @@ class WebGCodeGenerator:
                 lines.append(generate_linear_move(z=-current_depth, feed=params.plunge_rate))
 
             # Execute path moves
-            current_x, current_y = config.profile_start
-            for move in config.moves:
-                # Apply corner slowdown if configured
-                move_feed = current_feed
-                if config.apply_corner_slowdown and move.corner_feed_factor < 1.0:
-                    move_feed = self._get_adjusted_feed(
-                        params.feed_rate, pass_num,
-                        is_arc=(move.move_type == 'arc'),
-                        corner_factor=move.corner_feed_factor
-                    )
-                elif move.move_type == 'arc':
-                    move_feed = self._get_adjusted_feed(
-                        params.feed_rate, pass_num, is_arc=True
-                    )
+            # Arc and corner slowdown per move (corner factors only if configured)
+            move_feeds = self.safety_coordinator.get_adjusted_feeds(params.feed_rate, [
+                FeedContext(
+                    base_feed=params.feed_rate,
+                    pass_num=pass_num,
+                    is_arc=(move.move_type == 'arc'),
+                    corner_factor=move.corner_feed_factor if config.apply_corner_slowdown else 1.0
+                )
+                for move in config.moves
+            ])
 
+            current_x, current_y = config.profile_start
+            for move, move_feed in zip(config.moves, move_feeds):
                 lines.append(self._generate_move_from_path(move, (current_x, current_y), move_feed))
                 current_x, current_y = move.x, move.y
 
@@ -395,15 +393,15 @@ class WebGCodeGenerator:
             lead_in_type = self.settings.circle_lead_in_type
             approach_angle = 90  # Default for auto mode
 
-        # Convert approach angle to math angle for profile start calculation
+        # Approach direction as a unit vector for profile start calculation
         # User angle convention: 0° = top, 90° = right (clockwise)
         # Math convention: 0° = right, 90° = top (counter-clockwise)
-        math_angle = math.radians(90 - approach_angle)
+        cos_a, sin_a = _approach_unit_vector(approach_angle)
 
         # Profile start at approach angle position
         profile_start = (
-            cx + cut_radius * math.cos(math_angle),
-            cy + cut_radius * math.sin(math_angle)
+            cx + cut_radius * cos_a,
+            cy + cut_radius * sin_a
         )
 
         # Configure lead-in
@@ -436,8 +434,8 @@ class WebGCodeGenerator:
             )
 
         # Circle is a single full-circle move with I/J pointing to center from approach angle
-        i_offset = -cut_radius * math.cos(math_angle)
-        j_offset = -cut_radius * math.sin(math_angle)
+        i_offset = -cut_radius * cos_a
+        j_offset = -cut_radius * sin_a
         moves = [PathMove(
             x=profile_start[0],
             y=profile_start[1],
@@ -993,8 +991,8 @@ class WebGCodeGenerator:
         # Apply first pass feed reduction with arc slowdown
         first_pass_arc_feed = self._get_adjusted_feed(params.feed_rate, pass_num=0, is_arc=True)
 
-        # Convert user angle to math angle for I/J calculations
-        math_angle = _user_angle_to_math_angle(approach_angle)
+        # Approach direction (cached unit vector) for I/J calculations
+        cos_a, sin_a = _approach_unit_vector(approach_angle)
 
         # Add dwell if specified (before plunge)
         if hold_time > 0:
@@ -1020,8 +1018,8 @@ class WebGCodeGenerator:
         elif effective_lead_in_type == 'ramp' and self.lead_in_distance > 0:
             # Ramp lead-in: start at lead-in point, ramp to profile start
             # Calculate movement from lead-in to profile (opposite of approach direction)
-            dx = -self.lead_in_distance * math.cos(math_angle)
-            dy = -self.lead_in_distance * math.sin(math_angle)
+            dx = -self.lead_in_distance * cos_a
+            dy = -self.lead_in_distance * sin_a
 
             lines.append("G91")
             if abs(dy) < 0.0001:
@@ -1042,16 +1040,16 @@ class WebGCodeGenerator:
             lines.append("G90")
 
         # Full circle arc at first-pass-reduced arc feed
-        i_offset = -cut_radius * math.cos(math_angle)
-        j_offset = -cut_radius * math.sin(math_angle)
+        i_offset = -cut_radius * cos_a
+        j_offset = -cut_radius * sin_a
         lines.append(f"G02 I{format_coordinate(i_offset)} J{format_coordinate(j_offset)} F{format_coordinate(first_pass_arc_feed, 1)}")
 
         # Lead-out based on entry type (stay at depth for subroutine to continue)
         if effective_lead_in_type == 'helical' and helix_radius is not None and helix_radius > 0:
             # Arc back to helix start position
             if abs(helix_radius - cut_radius) > 0.001:
-                delta_x = (helix_radius - cut_radius) * math.cos(math_angle)
-                delta_y = (helix_radius - cut_radius) * math.sin(math_angle)
+                delta_x = (helix_radius - cut_radius) * cos_a
+                delta_y = (helix_radius - cut_radius) * sin_a
                 lines.append("G91")
                 lines.append(
                     f"G02 X{format_coordinate(delta_x)} Y{format_coordinate(delta_y)} "
@@ -1060,8 +1058,8 @@ class WebGCodeGenerator:
                 lines.append("G90")
         elif effective_lead_in_type == 'ramp' and self.lead_in_distance > 0:
             # Return to lead-in point at cutting depth
-            delta_x = self.lead_in_distance * math.cos(math_angle)
-            delta_y = self.lead_in_distance * math.sin(math_angle)
+            delta_x = self.lead_in_distance * cos_a
+            delta_y = self.lead_in_distance * sin_a
             lines.append("G91")
             # Use base feed rate for lead-out (linear move, not arc)
             first_pass_linear_feed = self._get_adjusted_feed(params.feed_rate, pass_num=0, is_arc=False)
@@ -1262,8 +1260,8 @@ class WebGCodeGenerator:
         # For helical lead-in arcs, use arc slowdown
         first_pass_arc_feed = self._get_adjusted_feed(params.feed_rate, pass_num=0, is_arc=True)
 
-        # Convert user angle to math angle for helix position calculations
-        math_angle = _user_angle_to_math_angle(approach_angle)
+        # Approach direction (cached unit vector) for helix position calculations
+        cos_a, sin_a = _approach_unit_vector(approach_angle)
 
         # Add dwell if specified (before plunge)
         if hold_time > 0:
@@ -1286,8 +1284,8 @@ class WebGCodeGenerator:
                 relative_z=True,
             ))
             # Track helix end position for lead-out
-            helix_end_x = cx + helix_radius * math.cos(math_angle)
-            helix_end_y = cy + helix_radius * math.sin(math_angle)
+            helix_end_x = cx + helix_radius * cos_a
+            helix_end_y = cy + helix_radius * sin_a
 
         elif effective_lead_in_type == 'ramp' and lead_in_point is not None:
             # Ramp lead-in: ramp from lead-in point to profile start
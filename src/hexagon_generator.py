@@ -6,6 +6,43 @@ and tool compensation.
 import math
 from typing import List, Tuple
 
+# Flat-to-flat / circumradius ratio of a regular hexagon; public so the
+# tube void checks and tool compensation use the same value
+SQRT3 = math.sqrt(3)
+
+# Unit vectors from center to each vertex of a point-up hexagon, starting at
+# top (90°) and going clockwise: 90°, 30°, -30°, -90°, -150°, -210°. Public
+# so other outline code (e.g. the SVG preview) places vertices identically
+HEX_UNIT_VECTORS = tuple(
+    (math.cos(math.pi / 2 - i * math.pi / 3), math.sin(math.pi / 2 - i * math.pi / 3))
+    for i in range(6)
+)
+
+
+def hexagon_points(
+    center_x: float,
+    center_y: float,
+    radius: float
+) -> List[Tuple[float, float]]:
+    """
+    Place the six point-up vertex directions at radius from the center.
+
+    Shared by the plain and tool-compensated vertex calculations, which
+    differ only in the radius used.
+
+    Args:
+        center_x: X coordinate of hexagon center
+        center_y: Y coordinate of hexagon center
+        radius: Distance from center to each vertex
+
+    Returns:
+        List of 6 (x, y) vertex tuples in clockwise order from top
+    """
+    return [
+        (center_x + radius * ux, center_y + radius * uy)
+        for ux, uy in HEX_UNIT_VECTORS
+    ]
+
 
 def calculate_hexagon_vertices(
     center_x: float,
@@ -33,23 +70,11 @@ def calculate_hexagon_vertices(
     Returns:
         List of 6 (x, y) vertex tuples in clockwise order from top
     """
-    # Apothem is distance from center to middle of flat side
-    apothem = flat_to_flat / 2
-
     # Circumradius is distance from center to vertex
     # For regular hexagon: circumradius = apothem / cos(30°) = apothem / (√3/2)
-    circumradius = flat_to_flat / math.sqrt(3)
-
-    # Generate vertices starting at top (90°), going clockwise
-    # Clockwise means decreasing angles in standard math coordinates
-    vertices = []
-    for i in range(6):
-        angle = math.pi / 2 - i * math.pi / 3  # 90°, 30°, -30°, -90°, -150°, -210°
-        x = center_x + circumradius * math.cos(angle)
-        y = center_y + circumradius * math.sin(angle)
-        vertices.append((x, y))
+    circumradius = flat_to_flat / SQRT3
 
-    return vertices
+    return hexagon_points(center_x, center_y, circumradius)
 
 
 def calculate_compensated_vertices(
@@ -101,9 +126,10 @@ def get_hexagon_start_position(
     Returns:
         (x, y) tuple of the starting vertex
     """
-    if not vertices:
+    try:
+        return vertices[0]
+    except IndexError:
         return (0, 0)
-    return vertices[0]
 
 
 def calculate_hexagon_bounds(
@@ -123,7 +149,7 @@ def calculate_hexagon_bounds(
         Tuple of (min_x, min_y, max_x, max_y)
     """
     apothem = flat_to_flat / 2
-    circumradius = flat_to_flat / math.sqrt(3)
+    circumradius = flat_to_flat / SQRT3
 
     # For point-up orientation:
     # - X extent is ±apothem (distance to flat sides)
@@ -5,6 +5,28 @@ Expands pattern definitions (linear, grid) into individual coordinates.
 from typing import List, Tuple, Dict, Any
 
 
+def _expand_linear_x(start_x: float, start_y: float, step: float, count: int) -> List[Tuple[float, float]]:
+    """Points stepping along X from (start_x, start_y)."""
+    return [(start_x + i * step, start_y) for i in range(count)]
+
+
+def _expand_linear_y(start_x: float, start_y: float, step: float, count: int) -> List[Tuple[float, float]]:
+    """Points stepping along Y from (start_x, start_y)."""
+    return [(start_x, start_y + i * step) for i in range(count)]
+
+
+# Canonical axis values -> (axis expander, negative direction); anything else is
+# normalized with lower()/strip() first
+_AXIS_DIRECTIONS = {
+    'x': (_expand_linear_x, False),
+    'x+': (_expand_linear_x, False),
+    'x-': (_expand_linear_x, True),
+    'y': (_expand_linear_y, False),
+    'y+': (_expand_linear_y, False),
+    'y-': (_expand_linear_y, True),
+}
+
+
 def expand_linear_pattern(
     start_x: float,
     start_y: float,
@@ -27,14 +49,17 @@ def expand_linear_pattern(
     Returns:
         List of (x, y) coordinate tuples
     """
-    axis = axis.lower().strip()
-    # Determine direction multiplier
-    if axis.startswith('x'):
-        sign = -1 if axis.endswith('-') else 1
-        return [(start_x + i * spacing * sign, start_y) for i in range(count)]
-    else:
-        sign = -1 if axis.endswith('-') else 1
-        return [(start_x, start_y + i * spacing * sign) for i in range(count)]
+    direction = _AXIS_DIRECTIONS.get(axis)
+    if direction is None:
+        axis = axis.lower().strip()
+        direction = (
+            _expand_linear_x if axis.startswith('x') else _expand_linear_y,
+            axis.endswith('-'),
+        )
+    expand, negative = direction
+
+    # Signed step along the axis (negating is exact, so this matches i * spacing * sign)
+    return expand(start_x, start_y, -spacing if negative else spacing, count)
 
 
 def expand_grid_pattern(
@@ -61,13 +86,10 @@ def expand_grid_pattern(
     Returns:
         List of (x, y) coordinate tuples
     """
-    points = []
-    for row in range(y_count):
-        for col in range(x_count):
-            x = start_x + col * x_spacing
-            y = start_y + row * y_spacing
-            points.append((x, y))
-    return points
+    # Column and row coordinates repeat across the grid, so compute each once
+    xs = [start_x + col * x_spacing for col in range(x_count)]
+    ys = [start_y + row * y_spacing for row in range(y_count)]
+    return [(x, y) for y in ys for x in xs]
 
 
 def expand_drill_operations(operations: List[Dict[str, Any]]) -> List[Tuple[float, float]]:
@@ -89,19 +111,17 @@ def expand_drill_operations(operations: List[Dict[str, Any]]) -> List[Tuple[floa
             points.append((op['x'], op['y']))
 
         elif op_type == 'pattern_linear':
-            expanded = expand_linear_pattern(
+            points.extend(expand_linear_pattern(
                 op['start_x'], op['start_y'],
                 op['axis'], op['spacing'], op['count']
-            )
-            points.extend(expanded)
+            ))
 
         elif op_type == 'pattern_grid':
-            expanded = expand_grid_pattern(
+            points.extend(expand_grid_pattern(
                 op['start_x'], op['start_y'],
                 op['x_spacing'], op['y_spacing'],
                 op['x_count'], op['y_count']
-            )
-            points.extend(expanded)
+            ))
 
     return points
 
@@ -121,8 +141,14 @@ def expand_circular_operations(operations: List[Dict[str, Any]]) -> List[Dict[st
     for op in operations:
         op_type = op.get('type', 'single')
 
-        # Extract lead-in settings that should be preserved when expanding
-        lead_in_settings = {
+        if op_type not in ('single', 'pattern_linear'):
+            continue
+
+        # Size, compensation and lead-in settings are shared by every
+        # expanded copy, so build them once per operation
+        shared = {
+            'diameter': op['diameter'],
+            'compensation': op.get('compensation', 'interior'),
             'lead_in_mode': op.get('lead_in_mode', 'auto'),
             'lead_in_type': op.get('lead_in_type', 'helical'),
             'lead_in_approach_angle': op.get('lead_in_approach_angle', 90)
@@ -132,24 +158,18 @@ def expand_circular_operations(operations: List[Dict[str, Any]]) -> List[Dict[st
             circles.append({
                 'center_x': op['center_x'],
                 'center_y': op['center_y'],
-                'diameter': op['diameter'],
-                'compensation': op.get('compensation', 'interior'),
-                **lead_in_settings
+                **shared
             })
 
-        elif op_type == 'pattern_linear':
+        else:
             centers = expand_linear_pattern(
                 op['start_center_x'], op['start_center_y'],
                 op['axis'], op['spacing'], op['count']
             )
-            for cx, cy in centers:
-                circles.append({
-                    'center_x': cx,
-                    'center_y': cy,
-                    'diameter': op['diameter'],
-                    'compensation': op.get('compensation', 'interior'),
-                    **lead_in_settings
-                })
+            circles.extend(
+                {'center_x': cx, 'center_y': cy, **shared}
+                for cx, cy in centers
+            )
 
     return circles
 
@@ -169,8 +189,14 @@ def expand_hexagonal_operations(operations: List[Dict[str, Any]]) -> List[Dict[s
     for op in operations:
         op_type = op.get('type', 'single')
 
-        # Extract lead-in settings that should be preserved when expanding
-        lead_in_settings = {
+        if op_type not in ('single', 'pattern_linear'):
+            continue
+
+        # Size, compensation and lead-in settings are shared by every
+        # expanded copy, so build them once per operation
+        shared = {
+            'flat_to_flat': op['flat_to_flat'],
+            'compensation': op.get('compensation', 'interior'),
             'lead_in_mode': op.get('lead_in_mode', 'auto'),
             'lead_in_type': op.get('lead_in_type', 'helical'),
             'lead_in_approach_angle': op.get('lead_in_approach_angle', 90)
@@ -180,24 +206,18 @@ def expand_hexagonal_operations(operations: List[Dict[str, Any]]) -> List[Dict[s
             hexagons.append({
                 'center_x': op['center_x'],
                 'center_y': op['center_y'],
-                'flat_to_flat': op['flat_to_flat'],
-                'compensation': op.get('compensation', 'interior'),
-                **lead_in_settings
+                **shared
             })
 
-        elif op_type == 'pattern_linear':
+        else:
             centers = expand_linear_pattern(
                 op['start_center_x'], op['start_center_y'],
                 op['axis'], op['spacing'], op['count']
             )
-            for cx, cy in centers:
-                hexagons.append({
-                    'center_x': cx,
-                    'center_y': cy,
-                    'flat_to_flat': op['flat_to_flat'],
-                    'compensation': op.get('compensation', 'interior'),
-                    **lead_in_settings
-                })
+            hexagons.extend(
+                {'center_x': cx, 'center_y': cy, **shared}
+                for cx, cy in centers
+            )
 
     return hexagons
 
@@ -218,9 +238,12 @@ def expand_line_operations(operations: List[Dict[str, Any]]) -> List[Dict[str, A
     line_cuts = []
 
     for op in operations:
-        op_type = op.get('type', 'single')
+        if op.get('type', 'single') != 'pattern_linear':
+            # Pass through unchanged (includes legacy ops without type field)
+            line_cuts.append(op)
+            continue
 
-        # Extract shared settings
+        # Extract shared settings (only patterns build new line cut dicts)
         shared = {
             'compensation': op.get('compensation', 'none'),
             'hold_time': op.get('hold_time', 0),
@@ -229,28 +252,23 @@ def expand_line_operations(operations: List[Dict[str, Any]]) -> List[Dict[str, A
             'lead_in_approach_angle': op.get('lead_in_approach_angle', 90),
         }
 
-        if op_type == 'single' or op_type not in ('single', 'pattern_linear'):
-            # Pass through unchanged (includes legacy ops without type field)
-            line_cuts.append(op)
-
-        elif op_type == 'pattern_linear':
-            offsets = expand_linear_pattern(
-                0, 0,
-                op['axis'], op['spacing'], op['count']
-            )
-            base_points = op.get('points', [])
-            for dx, dy in offsets:
-                offset_points = []
-                for pt in base_points:
-                    new_pt = dict(pt)
-                    new_pt['x'] = pt['x'] + dx
-                    new_pt['y'] = pt['y'] + dy
-                    if 'arc_center_x' in pt:
-                        new_pt['arc_center_x'] = pt['arc_center_x'] + dx
-                    if 'arc_center_y' in pt:
-                        new_pt['arc_center_y'] = pt['arc_center_y'] + dy
-                    offset_points.append(new_pt)
-                line_cuts.append({**shared, 'points': offset_points})
+        offsets = expand_linear_pattern(
+            0, 0,
+            op['axis'], op['spacing'], op['count']
+        )
+        base_points = op.get('points', [])
+        for dx, dy in offsets:
+            offset_points = []
+            for pt in base_points:
+                new_pt = dict(pt)
+                new_pt['x'] = pt['x'] + dx
+                new_pt['y'] = pt['y'] + dy
+                if 'arc_center_x' in pt:
+                    new_pt['arc_center_x'] = pt['arc_center_x'] + dx
+                if 'arc_center_y' in pt:
+                    new_pt['arc_center_y'] = pt['arc_center_y'] + dy
+                offset_points.append(new_pt)
+            line_cuts.append({**shared, 'points': offset_points})
 
     return line_cuts
 
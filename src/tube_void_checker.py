@@ -2,9 +2,13 @@
 
 For tube stock, operations falling entirely within the hollow center should be skipped.
 """
+from functools import lru_cache
 from typing import List, Tuple, Dict, Any, Optional
 
+from .hexagon_generator import SQRT3
 
+
+@lru_cache(maxsize=128)
 def calculate_void_bounds(
     outer_width: float,
     outer_height: float,
@@ -13,6 +17,8 @@ def calculate_void_bounds(
     """
     Calculate the void (hollow) region bounds for tube stock.
 
+    Cached: tubes of the same dimensions share one bounds tuple.
+
     Args:
         outer_width: Tube outer width (inches)
         outer_height: Tube outer height (inches)
@@ -49,6 +55,10 @@ def point_in_void(
     """
     void_x_min, void_y_min, void_x_max, void_y_max = void_bounds
 
+    # Bare point: strictly inside on both axes
+    if not tool_radius:
+        return void_x_min < x < void_x_max and void_y_min < y < void_y_max
+
     # Point with tool radius must be entirely inside void
     return (
         x - tool_radius > void_x_min and
@@ -108,10 +118,8 @@ def hexagon_in_void(
     Returns:
         True if hexagon is entirely within the void
     """
-    import math
-
     # For a point-up hexagon, circumradius extends further than apothem
-    circumradius = flat_to_flat / math.sqrt(3)
+    circumradius = flat_to_flat / SQRT3
 
     return point_in_void(
         center_x, center_y,
@@ -140,49 +148,90 @@ def filter_drill_points(
     skipped = []
     tool_radius = tool_diameter / 2
 
+    # Every point shares the drill radius, so shrink the void once and test
+    # the bare coordinates against it
+    void_x_min, void_y_min, void_x_max, void_y_max = void_bounds
+    x_min = void_x_min + tool_radius
+    y_min = void_y_min + tool_radius
+    x_max = void_x_max - tool_radius
+    y_max = void_y_max - tool_radius
+
+    keep = valid.append
+    skip = skipped.append
     for point in points:
         x, y = point
-        if point_in_void(x, y, void_bounds, tool_radius):
-            skipped.append(point)
+        if x_min < x < x_max and y_min < y < y_max:
+            skip(point)
         else:
-            valid.append(point)
+            keep(point)
 
     return valid, skipped
 
 
-def filter_circular_cuts(
+def _partition_cuts(
     cuts: List[Dict[str, float]],
     void_bounds: Tuple[float, float, float, float],
-    tool_diameter: float
+    size_key: str,
+    size_per_radius: float
 ) -> Tuple[List[Dict[str, float]], List[Dict[str, float]]]:
     """
-    Filter circular cuts, separating those in void from those on material.
+    Split cuts into (valid, skipped) by whether they sit entirely in the void.
+
+    Same test as point_in_void with the cut's outer radius, done inline so
+    the bounds are unpacked once per call rather than once per cut.
 
     Args:
-        cuts: List of circular cut dicts with center_x, center_y, diameter
+        cuts: List of cut dicts with center_x, center_y and size_key
         void_bounds: Void region bounds
-        tool_diameter: End mill diameter
+        size_key: Key holding the cut size (diameter, flat_to_flat)
+        size_per_radius: Divisor turning that size into the outer radius
 
     Returns:
         Tuple of (valid_cuts, skipped_cuts)
     """
     valid = []
     skipped = []
+    void_x_min, void_y_min, void_x_max, void_y_max = void_bounds
 
+    keep = valid.append
+    skip = skipped.append
     for cut in cuts:
-        if circle_in_void(
-            cut['center_x'], cut['center_y'],
-            cut['diameter'],
-            void_bounds,
-            tool_diameter
+        x = cut['center_x']
+        y = cut['center_y']
+        radius = cut[size_key] / size_per_radius
+        if (
+            x - radius > void_x_min and
+            x + radius < void_x_max and
+            y - radius > void_y_min and
+            y + radius < void_y_max
         ):
-            skipped.append(cut)
+            skip(cut)
         else:
-            valid.append(cut)
+            keep(cut)
 
     return valid, skipped
 
 
+def filter_circular_cuts(
+    cuts: List[Dict[str, float]],
+    void_bounds: Tuple[float, float, float, float],
+    tool_diameter: float
+) -> Tuple[List[Dict[str, float]], List[Dict[str, float]]]:
+    """
+    Filter circular cuts, separating those in void from those on material.
+
+    Args:
+        cuts: List of circular cut dicts with center_x, center_y, diameter
+        void_bounds: Void region bounds
+        tool_diameter: End mill diameter
+
+    Returns:
+        Tuple of (valid_cuts, skipped_cuts)
+    """
+    # Outer edge of the cut is half the diameter from center
+    return _partition_cuts(cuts, void_bounds, 'diameter', 2)
+
+
 def filter_hexagonal_cuts(
     cuts: List[Dict[str, float]],
     void_bounds: Tuple[float, float, float, float],
@@ -199,21 +248,8 @@ def filter_hexagonal_cuts(
     Returns:
         Tuple of (valid_cuts, skipped_cuts)
     """
-    valid = []
-    skipped = []
-
-    for cut in cuts:
-        if hexagon_in_void(
-            cut['center_x'], cut['center_y'],
-            cut['flat_to_flat'],
-            void_bounds,
-            tool_diameter
-        ):
-            skipped.append(cut)
-        else:
-            valid.append(cut)
-
-    return valid, skipped
+    # For a point-up hexagon, circumradius extends further than apothem
+    return _partition_cuts(cuts, void_bounds, 'flat_to_flat', SQRT3)
 
 
 def filter_operations_for_tube(
@@ -248,12 +284,13 @@ def filter_operations_for_tube(
         material.wall_thickness
     )
 
-    result = {
-        'line_cuts': expanded_ops.get('line_cuts', []),  # Line cuts not filtered
-        'skipped_drill_points': [],
-        'skipped_circular_cuts': [],
-        'skipped_hexagonal_cuts': []
-    }
+    # Shallow copy: unfiltered lists (line cuts are never filtered) are
+    # shared with the input, only the filtered keys are replaced below
+    result = expanded_ops.copy()
+    result.setdefault('line_cuts', [])
+    result['skipped_drill_points'] = []
+    result['skipped_circular_cuts'] = []
+    result['skipped_hexagonal_cuts'] = []
 
     # Filter drill points
     if drill_diameter:
@@ -265,7 +302,7 @@ def filter_operations_for_tube(
         result['drill_points'] = valid_drills
         result['skipped_drill_points'] = skipped_drills
     else:
-        result['drill_points'] = expanded_ops.get('drill_points', [])
+        result.setdefault('drill_points', [])
 
     # Filter circular cuts
     if end_mill_diameter:
@@ -285,7 +322,7 @@ def filter_operations_for_tube(
         result['hexagonal_cuts'] = valid_hexes
         result['skipped_hexagonal_cuts'] = skipped_hexes
     else:
-        result['circular_cuts'] = expanded_ops.get('circular_cuts', [])
-        result['hexagonal_cuts'] = expanded_ops.get('hexagonal_cuts', [])
+        result.setdefault('circular_cuts', [])
+        result.setdefault('hexagonal_cuts', [])
 
     return result
@@ -36,8 +36,8 @@ def calculate_segment_angle(
     v2y = p3[1] - p2[1]
 
     # Calculate magnitudes
-    mag1 = math.sqrt(v1x * v1x + v1y * v1y)
-    mag2 = math.sqrt(v2x * v2x + v2y * v2y)
+    mag1 = math.hypot(v1x, v1y)
+    mag2 = math.hypot(v2x, v2y)
 
     if mag1 < 0.0001 or mag2 < 0.0001:
         return 180.0  # Degenerate case - treat as straight
@@ -87,7 +87,7 @@ def get_arc_tangent_at_point(
         tx, ty = ry, -rx
 
     # Normalize
-    mag = math.sqrt(tx * tx + ty * ty)
+    mag = math.hypot(tx, ty)
     if mag < 0.0001:
         return (1.0, 0.0)  # Default direction
 
@@ -111,7 +111,7 @@ def calculate_direction_vector(
     dx = p2[0] - p1[0]
     dy = p2[1] - p1[1]
 
-    mag = math.sqrt(dx * dx + dy * dy)
+    mag = math.hypot(dx, dy)
     if mag < 0.0001:
         return (1.0, 0.0)  # Default direction
 
@@ -159,15 +159,20 @@ def identify_corners(
         return []
 
     corners = []
+    points = [(p.get('x', 0), p.get('y', 0)) for p in path]
+
+    # A straight segment's direction is the outgoing direction at its start
+    # vertex and the incoming direction at its end vertex; carry it forward
+    # so each segment is normalized once
+    segment_direction = None
 
     for i in range(1, len(path) - 1):
-        prev_point = path[i - 1]
         curr_point = path[i]
         next_point = path[i + 1]
 
-        p1 = (prev_point.get('x', 0), prev_point.get('y', 0))
-        p2 = (curr_point.get('x', 0), curr_point.get('y', 0))
-        p3 = (next_point.get('x', 0), next_point.get('y', 0))
+        p1 = points[i - 1]
+        p2 = points[i]
+        p3 = points[i + 1]
 
         # Get incoming direction
         curr_type = curr_point.get('line_type', 'straight')
@@ -182,7 +187,9 @@ def identify_corners(
             incoming = get_arc_tangent_at_point(center, p2, arc_dir)
         else:
             # Incoming is a line - direction from p1 to p2
-            incoming = calculate_direction_vector(p1, p2)
+            if segment_direction is None:
+                segment_direction = calculate_direction_vector(p1, p2)
+            incoming = segment_direction
 
         # Get outgoing direction
         next_type = next_point.get('line_type', 'straight')
@@ -195,9 +202,11 @@ def identify_corners(
             elif arc_dir.lower() == 'cw':
                 arc_dir = 'G02'
             outgoing = get_arc_tangent_at_point(center, p2, arc_dir)
+            segment_direction = None
         else:
             # Outgoing is a line - direction from p2 to p3
             outgoing = calculate_direction_vector(p2, p3)
+            segment_direction = outgoing
 
         # Calculate angle between directions
         angle = angle_between_vectors(incoming, outgoing)
@@ -268,47 +277,17 @@ def generate_corner_slowdown_points(
     Returns:
         New path with slowdown points inserted (includes 'corner_feed_factor' key)
     """
-    if len(path) < 3:
-        # Return original path with feed factors of 1.0
-        result = []
-        for p in path:
-            new_p = dict(p)
-            new_p['corner_feed_factor'] = 1.0
-            result.append(new_p)
-        return result
-
-    # Find all corners
-    corners = identify_corners(path, angle_threshold)
-
-    if not corners:
-        # No corners, return original path with feed factors of 1.0
-        result = []
-        for p in path:
-            new_p = dict(p)
-            new_p['corner_feed_factor'] = 1.0
-            result.append(new_p)
-        return result
-
-    # Create corner index set for quick lookup
-    corner_indices = {c['index']: c for c in corners}
-
-    # Build new path with feed factors
-    result = []
-    for i, point in enumerate(path):
-        new_point = dict(point)
-
-        if i in corner_indices:
-            # This is a corner point - apply reduced feed
-            corner = corner_indices[i]
-            angle_factor = calculate_corner_feed_factor(corner['angle'])
-            new_point['corner_feed_factor'] = base_feed_factor * angle_factor
-        else:
-            # Normal point
-            new_point['corner_feed_factor'] = 1.0
-
-        result.append(new_point)
-
-    return result
+    # Each point's factor depends only on its own corner (identify_corners
+    # returns none for paths under 3 points), so build the output in one pass
+    corner_factors = {
+        c['index']: base_feed_factor * calculate_corner_feed_factor(c['angle'])
+        for c in identify_corners(path, angle_threshold)
+    }
+
+    return [
+        {**point, 'corner_feed_factor': corner_factors.get(i, 1.0)}
+        for i, point in enumerate(path)
+    ]
 
 
 def get_corner_adjusted_feed(
@@ -3,9 +3,20 @@
 IMPORTANT: No function in this module generates comments.
 All output is pure G-code for Mach3 compatibility.
 """
-import re
+import string
 from typing import List, Optional
 
+# ASCII bytes dropped from project names: everything except alphanumerics,
+# underscores and hyphens (non-ASCII is dropped by the encode step)
+_NAME_DROP_BYTES = bytes(
+    b for b in range(128)
+    if chr(b) not in string.ascii_letters + string.digits + '_-'
+)
+
+# Bound str.format templates for the precisions G-code output uses
+# (coordinates at 4 places, feeds at 1); other precisions use an f-string
+_COORDINATE_FORMATS = {4: "{:.4f}".format, 1: "{:.1f}".format}
+
 
 def format_coordinate(value: float, precision: int = 4) -> str:
     """
@@ -18,7 +29,10 @@ def format_coordinate(value: float, precision: int = 4) -> str:
     Returns:
         Formatted string representation
     """
-    return f"{value:.{precision}f}"
+    fmt = _COORDINATE_FORMATS.get(precision)
+    if fmt is None:
+        return f"{value:.{precision}f}"
+    return fmt(value)
 
 
 def generate_header(
@@ -205,7 +219,11 @@ def sanitize_project_name(name: str) -> str:
     sanitized = name.replace(" ", "_")
 
     # Remove special characters except underscores, hyphens, and alphanumerics
-    sanitized = re.sub(r'[^a-zA-Z0-9_-]', '', sanitized)
+    sanitized = (
+        sanitized.encode('ascii', 'ignore')
+        .translate(None, _NAME_DROP_BYTES)
+        .decode('ascii')
+    )
 
     # Truncate to 50 characters
     return sanitized[:50]
@@ -15,6 +15,8 @@ Approach angle convention:
 - 270°: From left (9 o'clock)
 """
 import math
+from functools import lru_cache
+from itertools import accumulate, repeat
 from typing import Tuple, List, Optional
 
 from .gcode_format import (
@@ -54,6 +56,24 @@ def _user_angle_to_math_angle(user_angle: float) -> float:
     return math.radians(math_degrees)
 
 
+@lru_cache(maxsize=512)
+def _approach_unit_vector(user_angle: float) -> Tuple[float, float]:
+    """
+    Return (cos, sin) of the math angle for a user approach angle.
+
+    Approach angles come from a small set of values (mostly 0/90/180/270),
+    so caching avoids repeating the trig for every cut.
+
+    Args:
+        user_angle: Angle in degrees using user convention (0=top, clockwise)
+
+    Returns:
+        (cos, sin) unit vector pointing in the approach direction
+    """
+    math_angle = _user_angle_to_math_angle(user_angle)
+    return math.cos(math_angle), math.sin(math_angle)
+
+
 def calculate_lead_in_distance(ramp_angle: float, pass_depth: float) -> float:
     """
     Calculate lead-in distance from ramp angle and pass depth.
@@ -108,13 +128,13 @@ def calculate_circle_lead_in_point(
     Returns:
         (x, y) tuple of lead-in start point
     """
-    # Convert user angle to math angle
-    math_angle = _user_angle_to_math_angle(approach_angle)
+    # Unit vector toward the approach angle
+    cos_a, sin_a = _approach_unit_vector(approach_angle)
 
     # Profile start is on circle at the approach angle direction
     # Lead-in is radially outward (further from center) by lead_in_distance
-    lead_in_x = center_x + (cut_radius + lead_in_distance) * math.cos(math_angle)
-    lead_in_y = center_y + (cut_radius + lead_in_distance) * math.sin(math_angle)
+    lead_in_x = center_x + (cut_radius + lead_in_distance) * cos_a
+    lead_in_y = center_y + (cut_radius + lead_in_distance) * sin_a
     return (lead_in_x, lead_in_y)
 
 
@@ -149,14 +169,14 @@ def calculate_hexagon_lead_in_point(
     # If approach_angle is specified and we have center, use radial method
     if approach_angle is not None and center is not None:
         cx, cy = center
-        math_angle = _user_angle_to_math_angle(approach_angle)
+        cos_a, sin_a = _approach_unit_vector(approach_angle)
 
         # Calculate distance from center to first vertex
-        vertex_dist = math.sqrt((v0_x - cx) ** 2 + (v0_y - cy) ** 2)
+        vertex_dist = math.hypot(v0_x - cx, v0_y - cy)
 
         # Lead-in point is at approach angle, distance = vertex_dist + lead_in_distance
-        lead_in_x = cx + (vertex_dist + lead_in_distance) * math.cos(math_angle)
-        lead_in_y = cy + (vertex_dist + lead_in_distance) * math.sin(math_angle)
+        lead_in_x = cx + (vertex_dist + lead_in_distance) * cos_a
+        lead_in_y = cy + (vertex_dist + lead_in_distance) * sin_a
         return (lead_in_x, lead_in_y)
 
     # Default: extend the line from v0 to v1 backwards
@@ -165,18 +185,16 @@ def calculate_hexagon_lead_in_point(
     # Direction from v0 to v1
     dx = v1_x - v0_x
     dy = v1_y - v0_y
-    length = math.sqrt(dx * dx + dy * dy)
+    length = math.hypot(dx, dy)
 
     if length < 0.0001:
         return (v0_x, v0_y)
 
-    # Normalize and reverse direction
-    dx /= length
-    dy /= length
-
-    # Lead-in point is v0 minus direction * distance
-    lead_in_x = v0_x - dx * lead_in_distance
-    lead_in_y = v0_y - dy * lead_in_distance
+    # Lead-in point is v0 minus the unit edge direction * distance; fold the
+    # normalization into one scale factor instead of dividing each component
+    scale = lead_in_distance / length
+    lead_in_x = v0_x - dx * scale
+    lead_in_y = v0_y - dy * scale
 
     return (lead_in_x, lead_in_y)
 
@@ -245,9 +263,9 @@ def calculate_line_lead_in_point(
 
     # If approach_angle is specified, use it to calculate lead-in point
     if approach_angle is not None:
-        math_angle = _user_angle_to_math_angle(approach_angle)
-        lead_in_x = p0_x + lead_in_distance * math.cos(math_angle)
-        lead_in_y = p0_y + lead_in_distance * math.sin(math_angle)
+        cos_a, sin_a = _approach_unit_vector(approach_angle)
+        lead_in_x = p0_x + lead_in_distance * cos_a
+        lead_in_y = p0_y + lead_in_distance * sin_a
         return (lead_in_x, lead_in_y)
 
     p1 = path[1]
@@ -256,14 +274,16 @@ def calculate_line_lead_in_point(
     # Direction from p0 to p1
     dx = p1_x - p0_x
     dy = p1_y - p0_y
-    length = math.sqrt(dx * dx + dy * dy)
+    length = math.hypot(dx, dy)
 
     if length < 0.0001:
         return (p0_x, p0_y)
 
-    # Normalize direction
-    dx /= length
-    dy /= length
+    # Scale the direction straight to lead_in_distance; every branch below
+    # only ever needs the unit direction multiplied by that distance
+    scale = lead_in_distance / length
+    step_x = dx * scale
+    step_y = dy * scale
 
     # Check if path is closed and compensation is applied
     path_is_closed = is_closed_path(path)
@@ -272,10 +292,10 @@ def calculate_line_lead_in_point(
         # For closed paths with compensation, offset perpendicular to path
         # toward the waste side (interior for interior cuts, exterior for exterior)
 
-        # Calculate perpendicular (normal) direction
+        # Calculate perpendicular (normal) offset
         # (-dy, dx) points LEFT of the path direction
-        nx = -dy
-        ny = dx
+        normal_x = -step_y
+        normal_y = step_x
 
         # Determine which way is "inside" based on path winding
         winding = _calculate_path_winding(path)
@@ -286,26 +306,26 @@ def calculate_line_lead_in_point(
             # Interior cut: waste is inside, lead-in should be inside
             if winding >= 0:
                 # CCW path: inside is LEFT (positive normal direction)
-                lead_in_x = p0_x + nx * lead_in_distance
-                lead_in_y = p0_y + ny * lead_in_distance
+                lead_in_x = p0_x + normal_x
+                lead_in_y = p0_y + normal_y
             else:
                 # CW path: inside is RIGHT (negative normal direction)
-                lead_in_x = p0_x - nx * lead_in_distance
-                lead_in_y = p0_y - ny * lead_in_distance
+                lead_in_x = p0_x - normal_x
+                lead_in_y = p0_y - normal_y
         else:  # exterior
             # Exterior cut: waste is outside, lead-in should be outside
             if winding >= 0:
                 # CCW path: outside is RIGHT (negative normal direction)
-                lead_in_x = p0_x - nx * lead_in_distance
-                lead_in_y = p0_y - ny * lead_in_distance
+                lead_in_x = p0_x - normal_x
+                lead_in_y = p0_y - normal_y
             else:
                 # CW path: outside is LEFT (positive normal direction)
-                lead_in_x = p0_x + nx * lead_in_distance
-                lead_in_y = p0_y + ny * lead_in_distance
+                lead_in_x = p0_x + normal_x
+                lead_in_y = p0_y + normal_y
     else:
         # Open path or no compensation: extend backward along path direction
-        lead_in_x = p0_x - dx * lead_in_distance
-        lead_in_y = p0_y - dy * lead_in_distance
+        lead_in_x = p0_x - step_x
+        lead_in_y = p0_y - step_y
 
     return (lead_in_x, lead_in_y)
 
@@ -544,10 +564,10 @@ def calculate_helix_start_point(
     Returns:
         (x, y) tuple of helix start point
     """
-    math_angle = _user_angle_to_math_angle(approach_angle)
+    cos_a, sin_a = _approach_unit_vector(approach_angle)
     return (
-        center_x + helix_radius * math.cos(math_angle),
-        center_y + helix_radius * math.sin(math_angle)
+        center_x + helix_radius * cos_a,
+        center_y + helix_radius * sin_a
     )
 
 
@@ -641,38 +661,39 @@ def generate_helical_entry(
     revolutions = calculate_helix_revolutions(target_depth, helix_pitch)
     depth_per_rev = target_depth / revolutions
 
-    # Convert user angle to math angle
-    math_angle = _user_angle_to_math_angle(approach_angle)
+    # Unit vector toward the approach angle
+    cos_a, sin_a = _approach_unit_vector(approach_angle)
 
     # I/J offset from start position to center (always points toward center)
-    i_offset = -helix_radius * math.cos(math_angle)
-    j_offset = -helix_radius * math.sin(math_angle)
+    i_offset = -helix_radius * cos_a
+    j_offset = -helix_radius * sin_a
+
+    # I/J words and ramped feeds are shared by every helix line, so format
+    # the offsets once and compute the feeds up front
+    ij_words = f"I{format_coordinate(i_offset)} J{format_coordinate(j_offset)}"
+    feeds = [
+        calculate_ramped_helix_feed(rev, revolutions, plunge_rate, ramp_target)
+        for rev in range(revolutions)
+    ]
 
     if center is not None:
         # Absolute mode: helix arcs use absolute XY + Z coordinates
-        start_x = center[0] + helix_radius * math.cos(math_angle)
-        start_y = center[1] + helix_radius * math.sin(math_angle)
-
-        current_depth = 0
-        for rev in range(revolutions):
-            current_depth += depth_per_rev
-            current_feed = calculate_ramped_helix_feed(rev, revolutions, plunge_rate, ramp_target)
-            lines.append(generate_arc_move(
-                "G02", start_x, start_y,
-                i_offset, j_offset,
-                feed=current_feed, z=-current_depth
-            ))
+        start_x = center[0] + helix_radius * cos_a
+        start_y = center[1] + helix_radius * sin_a
+        arc_words = f"G02 X{format_coordinate(start_x)} Y{format_coordinate(start_y)}"
+
+        depths = accumulate(repeat(depth_per_rev, revolutions))
+        lines.extend(
+            f"{arc_words} Z{format_coordinate(-depth)} {ij_words} F{format_coordinate(feed, 1)}"
+            for depth, feed in zip(depths, feeds)
+        )
     else:
         # Relative Z mode: X0 Y0 (full circle back to same position)
         if relative_z:
             lines.append("G91")
 
-        for rev in range(revolutions):
-            current_feed = calculate_ramped_helix_feed(rev, revolutions, plunge_rate, ramp_target)
-            lines.append(
-                f"G02 X0 Y0 Z{format_coordinate(-depth_per_rev)} "
-                f"I{format_coordinate(i_offset)} J{format_coordinate(j_offset)} F{format_coordinate(current_feed, 1)}"
-            )
+        arc_words = f"G02 X0 Y0 Z{format_coordinate(-depth_per_rev)} {ij_words}"
+        lines.extend(f"{arc_words} F{format_coordinate(feed, 1)}" for feed in feeds)
 
         if relative_z:
             lines.append("G90")
@@ -682,8 +703,8 @@ def generate_helical_entry(
         if abs(helix_radius - cut_radius) > 0.001:
             if center is not None:
                 # Absolute mode: arc to absolute target on cut profile
-                target_x = center[0] + cut_radius * math.cos(math_angle)
-                target_y = center[1] + cut_radius * math.sin(math_angle)
+                target_x = center[0] + cut_radius * cos_a
+                target_y = center[1] + cut_radius * sin_a
                 lines.append(generate_arc_move(
                     "G02", target_x, target_y,
                     i_offset, j_offset,
@@ -691,12 +712,12 @@ def generate_helical_entry(
                 ))
             else:
                 # Relative mode: delta XY from helix to cut profile
-                delta_x = (cut_radius - helix_radius) * math.cos(math_angle)
-                delta_y = (cut_radius - helix_radius) * math.sin(math_angle)
+                delta_x = (cut_radius - helix_radius) * cos_a
+                delta_y = (cut_radius - helix_radius) * sin_a
                 lines.append("G91")
                 lines.append(
                     f"G02 X{format_coordinate(delta_x)} Y{format_coordinate(delta_y)} "
-                    f"I{format_coordinate(i_offset)} J{format_coordinate(j_offset)} F{format_coordinate(transition_feed, 1)}"
+                    f"{ij_words} F{format_coordinate(transition_feed, 1)}"
                 )
                 lines.append("G90")
 
@@ -5,13 +5,13 @@ safety features. Each safety feature implements the FeedAdjuster protocol
 and is registered with the SafetyCoordinator.
 """
 from dataclasses import dataclass, field
-from typing import Protocol, List, TYPE_CHECKING
+from typing import Callable, Iterable, Protocol, List, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from src.gcode_generator import GenerationSettings
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FeedContext:
     """Context for feed rate adjustment decisions.
 
@@ -87,6 +87,20 @@ class SafetyCoordinator:
         """
         self.adjusters.append(adjuster)
 
+    def compile(self) -> Tuple[Callable[[float, FeedContext], float], ...]:
+        """Resolve the enabled adjusters into a fixed chain of adjust_feed calls.
+
+        The chain is built from the current adjusters and settings on every
+        call, so changes to the adjusters list or to settings in place are
+        always picked up.
+
+        Returns:
+            Tuple of bound adjust_feed methods, in registration order
+        """
+        return tuple(
+            adjuster.adjust_feed for adjuster in self.adjusters if adjuster.is_enabled()
+        )
+
     def get_adjusted_feed(self, base_feed: float, context: FeedContext) -> float:
         """Apply all enabled adjusters to get the final feed rate.
 
@@ -98,11 +112,32 @@ class SafetyCoordinator:
             Final adjusted feed rate after all applicable adjusters
         """
         feed = base_feed
-        for adjuster in self.adjusters:
-            if adjuster.is_enabled():
-                feed = adjuster.adjust_feed(feed, context)
+        for adjust_feed in self.compile():
+            feed = adjust_feed(feed, context)
         return feed
 
+    def get_adjusted_feeds(self, base_feed: float, contexts: Iterable[FeedContext]) -> List[float]:
+        """Apply all enabled adjusters to a batch of moves sharing one base feed.
+
+        Equivalent to calling get_adjusted_feed for each context, but resolves
+        the adjuster chain once for the whole batch.
+
+        Args:
+            base_feed: Starting feed rate before adjustments
+            contexts: One FeedContext per move
+
+        Returns:
+            Adjusted feed rate for each context, in order
+        """
+        chain = self.compile()
+        feeds = []
+        for context in contexts:
+            feed = base_feed
+            for adjust_feed in chain:
+                feed = adjust_feed(feed, context)
+            feeds.append(feed)
+        return feeds
+
 
 def create_safety_coordinator(settings: 'GenerationSettings') -> SafetyCoordinator:
     """Factory function to create a fully-configured SafetyCoordinator.
@@ -44,9 +44,10 @@ class CornerSlowdownAdjuster:
         Returns:
             Reduced feed rate at corners, unchanged otherwise
         """
-        if context.corner_factor < 1.0:
+        corner_factor = context.corner_factor
+        if corner_factor < 1.0:
             # Apply both the global corner factor and the point-specific severity
-            return feed * self.settings.corner_feed_factor * context.corner_factor
+            return feed * self.settings.corner_feed_factor * corner_factor
         return feed
 
     def is_enabled(self) -> bool:
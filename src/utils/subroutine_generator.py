@@ -1,5 +1,4 @@
 """Subroutine generation utilities for M98 calls."""
-import math
 from typing import List, Tuple, Optional
 
 from .gcode_format import (
@@ -9,7 +8,7 @@ from .gcode_format import (
     generate_arc_move,
     generate_subroutine_end
 )
-from .lead_in import generate_helical_entry, _user_angle_to_math_angle
+from .lead_in import generate_helical_entry, _approach_unit_vector
 
 
 # Subroutine number ranges by operation type
@@ -100,14 +99,14 @@ def generate_ramp_preamble_circle(
     Returns:
         List of preamble G-code commands
     """
-    # Convert user angle to math angle
-    math_angle = _user_angle_to_math_angle(approach_angle)
+    # Approach direction (cached unit vector)
+    cos_a, sin_a = _approach_unit_vector(approach_angle)
 
     # Calculate XY offset from lead-in to profile start (opposite of approach direction)
     # Lead-in is at (profile + lead_in_distance in approach direction)
     # So movement is from lead-in toward center (negative of approach direction)
-    dx = -lead_in_distance * math.cos(math_angle)
-    dy = -lead_in_distance * math.sin(math_angle)
+    dx = -lead_in_distance * cos_a
+    dy = -lead_in_distance * sin_a
 
     # Only include Y in command if it's non-zero (to minimize G-code changes from original)
     if abs(dy) < 0.0001:
@@ -378,8 +377,8 @@ def generate_circle_pass_subroutine(
     # Apply arc slowdown to feed rate for all arc moves
     arc_feed = feed_rate * arc_feed_factor
 
-    # Convert user angle to math angle for I/J calculations
-    math_angle = _user_angle_to_math_angle(approach_angle)
+    # Approach direction (cached unit vector) for I/J calculations
+    cos_a, sin_a = _approach_unit_vector(approach_angle)
 
     if lead_in_type == 'helical' and helix_radius is not None and helix_radius > 0:
         # Helical lead-in: spiral down then arc to profile
@@ -400,15 +399,15 @@ def generate_circle_pass_subroutine(
         lines.insert(1, f"G04 P{hold_time_ms}")
 
     # Full circle arc - I/J point from current position (at approach angle) to center
-    i_offset = -cut_radius * math.cos(math_angle)
-    j_offset = -cut_radius * math.sin(math_angle)
+    i_offset = -cut_radius * cos_a
+    j_offset = -cut_radius * sin_a
     lines.append(f"G02 I{format_coordinate(i_offset)} J{format_coordinate(j_offset)} F{format_coordinate(arc_feed, 1)}")
 
     if lead_in_type == 'helical' and helix_radius is not None and helix_radius > 0:
         # Lead-out for helical: arc back to helix start position
         if abs(helix_radius - cut_radius) > 0.001:
-            delta_x = (helix_radius - cut_radius) * math.cos(math_angle)
-            delta_y = (helix_radius - cut_radius) * math.sin(math_angle)
+            delta_x = (helix_radius - cut_radius) * cos_a
+            delta_y = (helix_radius - cut_radius) * sin_a
             lines.append("G91")
             lines.append(
                 f"G02 X{format_coordinate(delta_x)} Y{format_coordinate(delta_y)} "
@@ -419,8 +418,8 @@ def generate_circle_pass_subroutine(
         # Lead-out: return to lead-in point at cutting depth
         # After circle, we're at profile start (at approach angle position)
         # Move radially outward by lead_in_distance in the approach direction
-        delta_x = lead_in_distance * math.cos(math_angle)
-        delta_y = lead_in_distance * math.sin(math_angle)
+        delta_x = lead_in_distance * cos_a
+        delta_y = lead_in_distance * sin_a
         lines.append("G91")
         if abs(delta_y) < 0.0001:
             lines.append(f"G01 X{format_coordinate(delta_x)} F{format_coordinate(feed_rate, 1)}")
@@ -476,8 +475,8 @@ def generate_hexagon_pass_subroutine(
 
     profile_start_x, profile_start_y = vertices[0]
 
-    # Convert user angle to math angle for helix position calculations
-    math_angle = _user_angle_to_math_angle(approach_angle)
+    # Approach direction (cached unit vector) for helix position calculations
+    cos_a, sin_a = _approach_unit_vector(approach_angle)
 
     if lead_in_type == 'helical' and center is not None and helix_radius is not None and helix_radius > 0:
         # Helical lead-in: spiral down at center, then linear to first vertex
@@ -489,8 +488,8 @@ def generate_hexagon_pass_subroutine(
             approach_angle, arc_feed_factor
         ))
         # Track helix end position for lead-out (at approach angle)
-        helix_end_x = center_x + helix_radius * math.cos(math_angle)
-        helix_end_y = center_y + helix_radius * math.sin(math_angle)
+        helix_end_x = center_x + helix_radius * cos_a
+        helix_end_y = center_y + helix_radius * sin_a
     elif lead_in_type == 'ramp' and lead_in_point is not None:
         lead_in_x, lead_in_y = lead_in_point
         lines.extend(generate_ramp_preamble_absolute(
@@ -509,9 +508,9 @@ def generate_hexagon_pass_subroutine(
         lines.insert(1, f"G04 P{hold_time_ms}")
 
     # Cut to each vertex (starting from second, as we start at first)
-    for i in range(1, len(vertices)):
-        x, y = vertices[i]
-        lines.append(f"G01 X{format_coordinate(x)} Y{format_coordinate(y)} F{format_coordinate(feed_rate, 1)}")
+    lines.extend(
+        generate_linear_move(x=x, y=y, feed=feed_rate) for x, y in vertices[1:]
+    )
 
     # Close back to first vertex
     x, y = vertices[0]
@@ -607,17 +606,12 @@ def generate_line_path_subroutine(
                 arc_dir_hint
             )
 
-            lines.append(
-                f"{direction} X{format_coordinate(x)} Y{format_coordinate(y)} "
-                f"I{format_coordinate(i_offset)} J{format_coordinate(j_offset)} "
-                f"F{format_coordinate(feed_rate, 1)}"
-            )
+            lines.append(generate_arc_move(
+                direction, x, y, i_offset, j_offset, feed=feed_rate
+            ))
         else:
             # Straight line
-            lines.append(
-                f"G01 X{format_coordinate(x)} Y{format_coordinate(y)} "
-                f"F{format_coordinate(feed_rate, 1)}"
-            )
+            lines.append(generate_linear_move(x=x, y=y, feed=feed_rate))
 
         current_x = x
         current_y = y
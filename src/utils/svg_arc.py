@@ -34,6 +34,15 @@ our points are already Y-flipped, we use sweep=0 for CCW and sweep=1 for CW.
 import math
 from typing import Tuple, Optional
 
+# Arc direction -> clockwise flag; other spellings are lower()-ed first and
+# anything unrecognized (including None/'') means auto-detect
+_CLOCKWISE_BY_DIRECTION = {
+    'ccw': False,
+    'cw': True,
+    'CCW': False,
+    'CW': True,
+}
+
 
 def calculate_arc_angular_span(
     start_x: float, start_y: float,
@@ -53,20 +62,28 @@ def calculate_arc_angular_span(
     Returns:
         Angular span in degrees (always positive, 0-360)
     """
-    # Calculate angles from center to start and end points
-    start_angle = math.atan2(start_y - center_y, start_x - center_x)
-    end_angle = math.atan2(end_y - center_y, end_x - center_x)
+    start_dx = start_x - center_x
+    start_dy = start_y - center_y
+    end_dx = end_x - center_x
+    end_dy = end_y - center_y
+    if (start_dx or start_dy) and (end_dx or end_dy):
+        # Signed CCW angle from the start vector to the end vector in one atan2
+        # (cross product over dot product) instead of one atan2 per point
+        span = math.atan2(
+            start_dx * end_dy - start_dy * end_dx,
+            start_dx * end_dx + start_dy * end_dy
+        )
+    else:
+        # A point on the center has no direction; difference the per-point
+        # angles (atan2(0, 0) is 0) so zero-radius arcs keep their old span
+        span = math.atan2(end_dy, end_dx) - math.atan2(start_dy, start_dx)
+    span_degrees = math.degrees(span)
 
-    # Calculate the angular difference
+    # CW runs the other way around
     if clockwise:
-        # CW: subtract end from start (going backwards in angle)
-        span = start_angle - end_angle
-    else:
-        # CCW: subtract start from end (going forwards in angle)
-        span = end_angle - start_angle
+        span_degrees = -span_degrees
 
     # Normalize to 0-360 range
-    span_degrees = math.degrees(span)
     if span_degrees <= 0:
         span_degrees += 360
 
@@ -94,16 +111,18 @@ def calculate_svg_arc_flags(
     Returns:
         Tuple of (large_arc_flag, sweep_flag) for SVG arc command
     """
-    arc_dir = (arc_direction or '').lower()
-
-    # Determine the CNC direction
-    if arc_dir == 'ccw':
-        cw_in_cnc = False
-    elif arc_dir == 'cw':
-        cw_in_cnc = True
+    cw_in_cnc = _CLOCKWISE_BY_DIRECTION.get(arc_direction)
+    if cw_in_cnc is None and arc_direction:
+        cw_in_cnc = _CLOCKWISE_BY_DIRECTION.get(arc_direction.lower())
+
+    # Determine the CNC direction and the angular span in that direction
+    if cw_in_cnc is not None:
+        span = calculate_arc_angular_span(
+            start_x, start_y, end_x, end_y, center_x, center_y, clockwise=cw_in_cnc
+        )
     else:
         # Auto-detect: choose the shorter path
-        # Calculate which direction gives the shorter arc
+        # Both spans are needed for the comparison, so keep the chosen one
         ccw_span = calculate_arc_angular_span(
             start_x, start_y, end_x, end_y, center_x, center_y, clockwise=False
         )
@@ -111,11 +130,7 @@ def calculate_svg_arc_flags(
             start_x, start_y, end_x, end_y, center_x, center_y, clockwise=True
         )
         cw_in_cnc = cw_span < ccw_span
-
-    # Calculate the angular span for the chosen direction
-    span = calculate_arc_angular_span(
-        start_x, start_y, end_x, end_y, center_x, center_y, clockwise=cw_in_cnc
-    )
+        span = cw_span if cw_in_cnc else ccw_span
 
     # SVG sweep_flag: accounts for Y-axis inversion between CNC and SVG
     # In SVG's Y-down space, sweep=0 draws CCW on screen, sweep=1 draws CW on screen
@@ -136,7 +151,7 @@ def calculate_arc_radius(
     center_x: float, center_y: float
 ) -> float:
     """Calculate the radius of an arc from a point to its center."""
-    return math.sqrt((point_x - center_x) ** 2 + (point_y - center_y) ** 2)
+    return math.hypot(point_x - center_x, point_y - center_y)
 
 
 def cnc_to_svg_coords(
@@ -199,4 +214,6 @@ def generate_svg_arc_command(
         start_x, start_y, end_x, end_y, center_x, center_y, arc_direction
     )
 
-    return f"A {radius:.4f} {radius:.4f} 0 {large_arc_flag} {sweep_flag} {svg_end_x:.4f} {svg_end_y:.4f}"
+    # Circular arc: rx and ry are the same formatted radius
+    radius_text = f"{radius:.4f}"
+    return f"A {radius_text} {radius_text} 0 {large_arc_flag} {sweep_flag} {svg_end_x:.4f} {svg_end_y:.4f}"
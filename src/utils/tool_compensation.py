@@ -2,7 +2,14 @@
 import math
 from typing import List, Tuple, Dict, Optional
 
-from ..hexagon_generator import calculate_hexagon_vertices
+from ..hexagon_generator import SQRT3, hexagon_points, calculate_hexagon_vertices
+
+# Compensation mode -> sign of the tool-radius offset; unknown modes behave
+# like 'none'
+_COMPENSATION_SIGN = {
+    'interior': -1,
+    'exterior': 1,
+}
 
 
 def get_compensation_offset(tool_diameter: float, compensation: str) -> float:
@@ -22,12 +29,10 @@ def get_compensation_offset(tool_diameter: float, compensation: str) -> float:
         - -tool_radius for 'interior' (shrink path, cut inside)
         - +tool_radius for 'exterior' (expand path, cut outside)
     """
-    tool_radius = tool_diameter / 2
-    if compensation == 'interior':
-        return -tool_radius
-    elif compensation == 'exterior':
-        return tool_radius
-    return 0.0
+    sign = _COMPENSATION_SIGN.get(compensation)
+    if sign is None:
+        return 0.0
+    return sign * (tool_diameter / 2)
 
 
 def calculate_cut_radius(
@@ -78,7 +83,7 @@ def offset_point_inward(
     dy = cy - py
 
     # Distance from point to center
-    distance = math.sqrt(dx * dx + dy * dy)
+    distance = math.hypot(dx, dy)
 
     if distance == 0:
         return point
@@ -118,16 +123,13 @@ def calculate_hexagon_compensated_vertices(
     Returns:
         List of 6 compensated (x, y) vertex tuples
     """
-    # Get uncompensated vertices first
-    vertices = calculate_hexagon_vertices(center_x, center_y, flat_to_flat)
-
     if compensation == 'none':
-        return vertices
+        return calculate_hexagon_vertices(center_x, center_y, flat_to_flat)
 
     # For a regular hexagon, the offset along the angle bisector
     # is tool_radius / sin(60°) = tool_radius * 2 / sqrt(3)
     tool_radius = tool_diameter / 2
-    base_offset = tool_radius * 2 / math.sqrt(3)
+    base_offset = tool_radius * 2 / SQRT3
 
     # Interior: offset inward (positive offset_distance moves toward center)
     # Exterior: offset outward (negative offset_distance moves away from center)
@@ -136,14 +138,14 @@ def calculate_hexagon_compensated_vertices(
     else:  # exterior
         offset_distance = -base_offset
 
-    # Offset each vertex toward/away from center
-    center = (center_x, center_y)
-    compensated = []
-    for vertex in vertices:
-        comp_vertex = offset_point_inward(vertex, center, offset_distance)
-        compensated.append(comp_vertex)
+    # The angle bisector at each vertex is the radial line through the center,
+    # so compensation just changes the circumradius
+    circumradius = flat_to_flat / SQRT3
+    if circumradius == 0:
+        return calculate_hexagon_vertices(center_x, center_y, flat_to_flat)
+    compensated_radius = circumradius - offset_distance
 
-    return compensated
+    return hexagon_points(center_x, center_y, compensated_radius)
 
 
 def calculate_line_normal(
@@ -165,9 +167,16 @@ def calculate_line_normal(
     dx = p2[0] - p1[0]
     dy = p2[1] - p1[1]
 
-    length = math.sqrt(dx * dx + dy * dy)
-    if length == 0:
-        return (0.0, 0.0)
+    # Axis-aligned segments skip the hypot/divide; the zero component keeps
+    # the sign the general formula would give it
+    if dy == 0:
+        if dx == 0:
+            return (0.0, 0.0)
+        return (-dy, 1.0 if dx > 0 else -1.0)
+    if dx == 0:
+        return (-1.0 if dy > 0 else 1.0, dx)
+
+    length = math.hypot(dx, dy)
 
     # Perpendicular vector (rotate 90 degrees CCW)
     # (-dy, dx) points left of the direction vector
@@ -197,9 +206,11 @@ def offset_line_segment(
         Tuple of (new_p1, new_p2) offset points
     """
     nx, ny = calculate_line_normal(p1, p2)
+    ox = nx * offset
+    oy = ny * offset
 
-    new_p1 = (p1[0] + nx * offset, p1[1] + ny * offset)
-    new_p2 = (p2[0] + nx * offset, p2[1] + ny * offset)
+    new_p1 = (p1[0] + ox, p1[1] + oy)
+    new_p2 = (p2[0] + ox, p2[1] + oy)
 
     return (new_p1, new_p2)
 
@@ -227,21 +238,23 @@ def calculate_line_intersection(
     x3, y3 = l2_p1
     x4, y4 = l2_p2
 
-    # Line 1: (x2-x1)*y - (y2-y1)*x = (x2-x1)*y1 - (y2-y1)*x1
-    # Line 2: (x4-x3)*y - (y4-y3)*x = (x4-x3)*y3 - (y4-y3)*x3
+    # Direction vectors, each computed once
+    dx1 = x2 - x1
+    dy1 = y2 - y1
+    dx2 = x4 - x3
+    dy2 = y4 - y3
 
-    denom = (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4)
+    # Cramer's rule: cross product of the directions is the denominator
+    denom = dx1 * dy2 - dy1 * dx2
 
-    if abs(denom) < 1e-10:
+    if -1e-10 < denom < 1e-10:
         # Lines are parallel
         return None
 
-    t = ((x1 - x3) * (y3 - y4) - (y1 - y3) * (x3 - x4)) / denom
-
-    ix = x1 + t * (x2 - x1)
-    iy = y1 + t * (y2 - y1)
+    # Parameter along line 1 where it meets line 2
+    t = ((x3 - x1) * dy2 - (y3 - y1) * dx2) / denom
 
-    return (ix, iy)
+    return (x1 + t * dx1, y1 + t * dy1)
 
 
 def calculate_line_circle_intersection(
@@ -283,19 +296,13 @@ def calculate_line_circle_intersection(
     if discriminant < 0:
         return None  # No intersection
 
-    sqrt_disc = math.sqrt(discriminant)
-    t1 = (-B - sqrt_disc) / (2 * A)
-    t2 = (-B + sqrt_disc) / (2 * A)
+    # The root nearest prefer_near is the one on its side of the center
+    # along the line direction: the smaller t when the projection of
+    # (center - prefer_near) onto the direction is non-negative
+    side = dx * (center[0] - prefer_near[0]) + dy * (center[1] - prefer_near[1])
+    t = (-B - math.copysign(math.sqrt(discriminant), side)) / (2 * A)
 
-    # Calculate both intersection points
-    p1 = (line_p1[0] + t1 * dx, line_p1[1] + t1 * dy)
-    p2 = (line_p1[0] + t2 * dx, line_p1[1] + t2 * dy)
-
-    # Return the one closest to prefer_near
-    dist1 = (p1[0] - prefer_near[0])**2 + (p1[1] - prefer_near[1])**2
-    dist2 = (p2[0] - prefer_near[0])**2 + (p2[1] - prefer_near[1])**2
-
-    return p1 if dist1 <= dist2 else p2
+    return (line_p1[0] + t * dx, line_p1[1] + t * dy)
 
 
 def offset_arc_segment(
@@ -328,7 +335,7 @@ def offset_arc_segment(
     # Calculate original radius from start point to center
     dx_start = start['x'] - center_x
     dy_start = start['y'] - center_y
-    original_radius = math.sqrt(dx_start * dx_start + dy_start * dy_start)
+    original_radius = math.hypot(dx_start, dy_start)
 
     # Determine new radius based on compensation type
     if is_exterior:
@@ -402,13 +409,15 @@ def calculate_path_winding(path: List[Dict]) -> float:
     if len(path) < 3:
         return 0.0
 
-    area = 0.0
-    n = len(path)
+    # Shoelace over coordinates pulled out once; pairing each point with the
+    # next via a rotated copy replaces the modulo index and dict lookups
+    xs = [p['x'] for p in path]
+    ys = [p['y'] for p in path]
 
-    for i in range(n):
-        j = (i + 1) % n
-        area += path[i]['x'] * path[j]['y']
-        area -= path[j]['x'] * path[i]['y']
+    area = 0.0
+    for x_i, y_i, x_j, y_j in zip(xs, ys, xs[1:] + xs[:1], ys[1:] + ys[:1]):
+        area += x_i * y_j
+        area -= x_j * y_i
 
     return area / 2.0
 
@@ -510,7 +519,7 @@ def compensate_line_path(
                 mid_angle = (start_angle + end_angle) / 2
 
             # Sample point on the arc at mid angle
-            radius = math.sqrt((p1[0] - arc_center[0])**2 + (p1[1] - arc_center[1])**2)
+            radius = math.hypot(p1[0] - arc_center[0], p1[1] - arc_center[1])
             arc_mid_x = arc_center[0] + radius * math.cos(mid_angle)
             arc_mid_y = arc_center[1] + radius * math.sin(mid_angle)
 
@@ -541,8 +550,8 @@ def compensate_line_path(
             dy2 = p2[1] - arc_center[1]
 
             # Calculate radius for each endpoint independently
-            radius1 = math.sqrt(dx1 * dx1 + dy1 * dy1)
-            radius2 = math.sqrt(dx2 * dx2 + dy2 * dy2)
+            radius1 = math.hypot(dx1, dy1)
+            radius2 = math.hypot(dx2, dy2)
 
             new_radius1 = radius1 + radius_change
             new_radius2 = radius2 + radius_change
@@ -565,7 +574,6 @@ def compensate_line_path(
                 'start': new_p1,
                 'end': new_p2,
                 'center': arc_center,
-                'original_index': j,
                 'segment_source': segment_source
             })
         else:
@@ -575,7 +583,6 @@ def compensate_line_path(
                 'type': 'straight',
                 'start': new_p1,
                 'end': new_p2,
-                'original_index': j,
                 'segment_source': segment_source
             })
 
@@ -607,7 +614,7 @@ def compensate_line_path(
                     arc_center = prev_seg['center']
                     dx = prev_seg['end'][0] - arc_center[0]
                     dy = prev_seg['end'][1] - arc_center[1]
-                    arc_radius = math.sqrt(dx * dx + dy * dy)
+                    arc_radius = math.hypot(dx, dy)
                     intersection = calculate_line_circle_intersection(
                         seg['start'], seg['end'],
                         arc_center, arc_radius,
@@ -622,7 +629,7 @@ def compensate_line_path(
                     arc_center = seg['center']
                     dx = seg['start'][0] - arc_center[0]
                     dy = seg['start'][1] - arc_center[1]
-                    arc_radius = math.sqrt(dx * dx + dy * dy)
+                    arc_radius = math.hypot(dx, dy)
                     intersection = calculate_line_circle_intersection(
                         prev_seg['start'], prev_seg['end'],
                         arc_center, arc_radius,
@@ -663,7 +670,7 @@ def compensate_line_path(
                 # Use radius at arc end
                 dx = seg['end'][0] - arc_center[0]
                 dy = seg['end'][1] - arc_center[1]
-                arc_radius = math.sqrt(dx * dx + dy * dy)
+                arc_radius = math.hypot(dx, dy)
                 intersection = calculate_line_circle_intersection(
                     next_seg['start'], next_seg['end'],
                     arc_center, arc_radius,
@@ -679,7 +686,7 @@ def compensate_line_path(
                 # Use radius at arc start
                 dx = next_seg['start'][0] - arc_center[0]
                 dy = next_seg['start'][1] - arc_center[1]
-                arc_radius = math.sqrt(dx * dx + dy * dy)
+                arc_radius = math.hypot(dx, dy)
                 intersection = calculate_line_circle_intersection(
                     seg['start'], seg['end'],
                     arc_center, arc_radius,
@@ -714,11 +721,6 @@ def compensate_line_path(
             new_point = dict(original_point)
             new_point['x'] = corner_point[0]
             new_point['y'] = corner_point[1]
-
-            if seg['type'] == 'arc':
-                # Keep arc center unchanged
-                pass
-
             compensated_path.append(new_point)
         else:
             # Open path, last point
@@ -3,6 +3,10 @@ import math
 from typing import List, Tuple, Dict, Optional
 
 
+# Top-level keys of a project's operations JSON
+OPERATION_KEYS = ('drill_holes', 'circular_cuts', 'hexagonal_cuts', 'line_cuts')
+
+
 def validate_bounds(
     x: float,
     y: float,
@@ -201,12 +205,8 @@ def validate_arc_geometry(
         end_y = point.get('y', 0)
 
         # Calculate radii
-        start_radius = math.sqrt(
-            (start_x - center_x) ** 2 + (start_y - center_y) ** 2
-        )
-        end_radius = math.sqrt(
-            (end_x - center_x) ** 2 + (end_y - center_y) ** 2
-        )
+        start_radius = math.hypot(start_x - center_x, start_y - center_y)
+        end_radius = math.hypot(end_x - center_x, end_y - center_y)
 
         # Check if radii match
         radius_diff = abs(start_radius - end_radius)
@@ -290,3 +290,31 @@ def validate_feed_rates(
         )
 
     return warnings
+
+
+def validate_operations_structure(operations: Dict) -> List[str]:
+    """
+    Validate the shape of a project operations payload.
+
+    Each known key, when present, must map to a list of operation dicts.
+    Missing keys are allowed because every consumer defaults them to an
+    empty list.
+
+    Args:
+        operations: Operations dict as sent by the project editor
+
+    Returns:
+        List of error messages (empty if valid)
+    """
+    if not isinstance(operations, dict):
+        return ["Operations must be an object"]
+
+    errors = []
+    for key in OPERATION_KEYS:
+        ops = operations.get(key, [])
+        if not isinstance(ops, list):
+            errors.append(f"Operations '{key}' must be a list")
+        elif not all(isinstance(op, dict) for op in ops):
+            errors.append(f"Operations '{key}' must contain only objects")
+
+    return errors
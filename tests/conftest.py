@@ -1,6 +1,11 @@
 """Test configuration and fixtures."""
+from copy import deepcopy
+from functools import lru_cache
+
 import pytest
 from flask import Flask
+from sqlalchemy import event
+from sqlalchemy.orm import scoped_session, sessionmaker
 
 from app import create_app
 from web.extensions import db
@@ -11,24 +16,114 @@ class TestConfig:
     """Test configuration."""
     TESTING = True
     SECRET_KEY = 'test-secret-key'
+    # Flask-SQLAlchemy serves :memory: through a single StaticPool connection,
+    # so every session shares one in-memory database with no disk I/O.
+    # Under pytest-xdist each worker is its own process with its own database.
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     WTF_CSRF_ENABLED = False
     APP_PASSWORD = None  # Disable auth for tests
 
 
-@pytest.fixture
-def app():
-    """Create and configure a test application instance."""
-    app = create_app(TestConfig)
+def _enable_sqlite_savepoints(engine):
+    """
+    Let pysqlite nest SAVEPOINTs inside an outer transaction.
+
+    The driver otherwise manages BEGIN itself, so releasing the first
+    savepoint would commit it. See the SQLAlchemy pysqlite docs on
+    "Serializable isolation / Savepoints / Transactional DDL".
+    """
+    @event.listens_for(engine, 'connect')
+    def do_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, 'begin')
+    def do_begin(conn):
+        conn.exec_driver_sql('BEGIN')
+
+
+def _freeze_config(config_class):
+    """Return a config class's settings as a hashable, sorted tuple."""
+    return tuple(sorted(
+        (key, getattr(config_class, key))
+        for key in dir(config_class) if key.isupper()
+    ))
+
+
+@lru_cache(maxsize=8)
+def _make_app(config_items):
+    """Build one app per unique config so extensions initialize only once."""
+    app = create_app(type('FrozenConfig', (), dict(config_items)))
+    with app.app_context():
+        _enable_sqlite_savepoints(db.engine)
+    return app
+
+
+def pytest_collection_modifyitems(items):
+    """
+    Run DB-free tests before ``db`` tests.
+
+    The sort is stable, so each group keeps its module and class order and
+    the shared app is built only once the pure tests have finished.
+    """
+    items.sort(key=lambda item: item.get_closest_marker('db') is not None)
+
+
+@pytest.fixture(scope='session')
+def session_app():
+    """Create the application and schema once for the whole test session."""
+    app = _make_app(_freeze_config(TestConfig))
 
     with app.app_context():
         db.create_all()
         yield app
-        db.session.remove()
         db.drop_all()
 
 
+@pytest.fixture
+def db_session(session_app):
+    """
+    Run a test inside an outer transaction that is rolled back afterward.
+
+    Services still call db.session.commit(); with create_savepoint each
+    commit only releases a SAVEPOINT, so nothing outlives the test.
+    """
+    connection = db.engine.connect()
+    transaction = connection.begin()
+    # Plain Session: Flask-SQLAlchemy's get_bind() ignores the bind option
+    session = scoped_session(sessionmaker(
+        bind=connection,
+        join_transaction_mode='create_savepoint'
+    ))
+    original_session = db.session
+    db.session = session
+
+    yield session
+
+    session.remove()
+    db.session = original_session
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture
+def app(session_app, db_session):
+    """Provide the shared application inside a fresh app context."""
+    with session_app.app_context():
+        yield session_app
+
+
+@pytest.fixture(autouse=True)
+def _db_for_marked_tests(request):
+    """
+    Set up the database and app context only for tests marked with ``db``.
+
+    Marked tests therefore run inside an app context without opening one.
+    """
+    if request.node.get_closest_marker('db') is not None:
+        request.getfixturevalue('app')
+
+
 @pytest.fixture
 def client(app):
     """Create a test client."""
@@ -41,203 +136,196 @@ def runner(app):
     return app.test_cli_runner()
 
 
-@pytest.fixture
-def db_session(app):
-    """Provide a database session for tests."""
-    with app.app_context():
-        yield db.session
+def _seed(row):
+    """Insert a row inside the per-test transaction and return it."""
+    row = db.session.merge(row)
+    db.session.commit()
+    return row
+
+
+# Sample data is built once per session as plain dicts; the row fixtures
+# below insert it per test and db_session's rollback removes it again.
+
+@pytest.fixture(scope='session')
+def sample_material_data():
+    """Field values for the sample sheet material."""
+    return {
+        'id': 'test_aluminum_0125',
+        'display_name': 'Test Aluminum 1/8"',
+        'base_material': 'aluminum',
+        'form': 'sheet',
+        'thickness': 0.125,
+        'gcode_standards': {
+            'drill': {
+                '0.125': {'spindle_speed': 1000, 'feed_rate': 2.0, 'plunge_rate': 1.0, 'pecking_depth': 0.05}
+            },
+            'end_mill_1flute': {
+                '0.125': {'spindle_speed': 12000, 'feed_rate': 12.0, 'plunge_rate': 2.0, 'pass_depth': 0.025}
+            }
+        }
+    }
+
+
+@pytest.fixture(scope='session')
+def sample_tube_material_data():
+    """Field values for the sample tube material."""
+    return {
+        'id': 'test_tube_2x1',
+        'display_name': 'Test Tube 2x1',
+        'base_material': 'aluminum',
+        'form': 'tube',
+        'outer_width': 2.0,
+        'outer_height': 1.0,
+        'wall_thickness': 0.125,
+        'gcode_standards': {
+            'drill': {
+                '0.125': {'spindle_speed': 1000, 'feed_rate': 2.0, 'plunge_rate': 1.0, 'pecking_depth': 0.05}
+            }
+        }
+    }
+
+
+@pytest.fixture(scope='session')
+def sample_tool_data():
+    """Field values for the sample drill."""
+    return {
+        'tool_type': 'drill',
+        'size': 0.125,
+        'size_unit': 'in',
+        'description': '1/8" test drill'
+    }
+
+
+@pytest.fixture(scope='session')
+def sample_end_mill_data():
+    """Field values for the sample end mill."""
+    return {
+        'tool_type': 'end_mill_1flute',
+        'size': 0.125,
+        'size_unit': 'in',
+        'description': '1/8" test end mill'
+    }
+
+
+@pytest.fixture(scope='session')
+def machine_settings_data():
+    """Field values for the machine settings singleton."""
+    return {
+        'id': 1,
+        'name': 'Test CNC',
+        'max_x': 15.0,
+        'max_y': 15.0,
+        'units': 'inches',
+        'controller_type': 'mach3',
+        'supports_subroutines': True,
+        'supports_canned_cycles': True,
+        'gcode_base_path': 'C:\\Mach3\\GCode'
+    }
+
+
+@pytest.fixture(scope='session')
+def general_settings_data():
+    """Field values for the general settings singleton."""
+    return {
+        'id': 1,
+        'safety_height': 0.5,
+        'travel_height': 0.2,
+        'spindle_warmup_seconds': 2
+    }
 
 
 @pytest.fixture
-def sample_material(app):
+def sample_material(app, sample_material_data):
     """Create a sample material for testing."""
-    with app.app_context():
-        material = Material(
-            id='test_aluminum_0125',
-            display_name='Test Aluminum 1/8"',
-            base_material='aluminum',
-            form='sheet',
-            thickness=0.125,
-            gcode_standards={
-                'drill': {
-                    '0.125': {'spindle_speed': 1000, 'feed_rate': 2.0, 'plunge_rate': 1.0, 'pecking_depth': 0.05}
-                },
-                'end_mill_1flute': {
-                    '0.125': {'spindle_speed': 12000, 'feed_rate': 12.0, 'plunge_rate': 2.0, 'pass_depth': 0.025}
-                }
-            }
-        )
-        db.session.add(material)
-        db.session.commit()
-        yield material
+    return _seed(Material(**deepcopy(sample_material_data)))
 
 
 @pytest.fixture
-def sample_tube_material(app):
+def sample_tube_material(app, sample_tube_material_data):
     """Create a sample tube material for testing."""
-    with app.app_context():
-        material = Material(
-            id='test_tube_2x1',
-            display_name='Test Tube 2x1',
-            base_material='aluminum',
-            form='tube',
-            outer_width=2.0,
-            outer_height=1.0,
-            wall_thickness=0.125,
-            gcode_standards={
-                'drill': {
-                    '0.125': {'spindle_speed': 1000, 'feed_rate': 2.0, 'plunge_rate': 1.0, 'pecking_depth': 0.05}
-                }
-            }
-        )
-        db.session.add(material)
-        db.session.commit()
-        yield material
+    return _seed(Material(**deepcopy(sample_tube_material_data)))
 
 
 @pytest.fixture
-def sample_tool(app):
+def sample_tool(app, sample_tool_data):
     """Create a sample drill tool for testing."""
-    with app.app_context():
-        tool = Tool(
-            tool_type='drill',
-            size=0.125,
-            size_unit='in',
-            description='1/8" test drill'
-        )
-        db.session.add(tool)
-        db.session.commit()
-        yield tool
+    return _seed(Tool(**sample_tool_data))
 
 
 @pytest.fixture
-def sample_end_mill(app):
+def sample_end_mill(app, sample_end_mill_data):
     """Create a sample end mill tool for testing."""
-    with app.app_context():
-        tool = Tool(
-            tool_type='end_mill_1flute',
-            size=0.125,
-            size_unit='in',
-            description='1/8" test end mill'
-        )
-        db.session.add(tool)
-        db.session.commit()
-        yield tool
+    return _seed(Tool(**sample_end_mill_data))
 
 
 @pytest.fixture
 def sample_project(app, sample_material, sample_tool):
     """Create a sample project for testing."""
-    with app.app_context():
-        # Refresh to get IDs
-        material = Material.query.get(sample_material.id)
-        tool = Tool.query.get(sample_tool.id)
-
-        project = Project(
-            name='Test Project',
-            project_type='drill',
-            material_id=material.id,
-            drill_tool_id=tool.id,
-            operations={
-                'drill_holes': [
-                    {'id': 'hole1', 'type': 'single', 'x': 1.0, 'y': 1.0},
-                    {'id': 'hole2', 'type': 'single', 'x': 2.0, 'y': 2.0}
-                ],
-                'circular_cuts': [],
-                'hexagonal_cuts': [],
-                'line_cuts': []
-            }
-        )
-        db.session.add(project)
-        db.session.commit()
-        yield project
+    return _seed(Project(
+        name='Test Project',
+        project_type='drill',
+        material_id=sample_material.id,
+        drill_tool_id=sample_tool.id,
+        operations={
+            'drill_holes': [
+                {'id': 'hole1', 'type': 'single', 'x': 1.0, 'y': 1.0},
+                {'id': 'hole2', 'type': 'single', 'x': 2.0, 'y': 2.0}
+            ],
+            'circular_cuts': [],
+            'hexagonal_cuts': [],
+            'line_cuts': []
+        }
+    ))
 
 
 @pytest.fixture
 def sample_cut_project(app, sample_material, sample_end_mill):
     """Create a sample cut project for testing."""
-    with app.app_context():
-        material = Material.query.get(sample_material.id)
-        tool = Tool.query.get(sample_end_mill.id)
-
-        project = Project(
-            name='Test Cut Project',
-            project_type='cut',
-            material_id=material.id,
-            end_mill_tool_id=tool.id,
-            operations={
-                'drill_holes': [],
-                'circular_cuts': [
-                    {'id': 'circle1', 'type': 'single', 'center_x': 5.0, 'center_y': 5.0, 'diameter': 1.0}
-                ],
-                'hexagonal_cuts': [],
-                'line_cuts': []
-            }
-        )
-        db.session.add(project)
-        db.session.commit()
-        yield project
+    return _seed(Project(
+        name='Test Cut Project',
+        project_type='cut',
+        material_id=sample_material.id,
+        end_mill_tool_id=sample_end_mill.id,
+        operations={
+            'drill_holes': [],
+            'circular_cuts': [
+                {'id': 'circle1', 'type': 'single', 'center_x': 5.0, 'center_y': 5.0, 'diameter': 1.0}
+            ],
+            'hexagonal_cuts': [],
+            'line_cuts': []
+        }
+    ))
 
 
 @pytest.fixture
-def machine_settings(app):
+def machine_settings(app, machine_settings_data):
     """Create machine settings for testing."""
-    with app.app_context():
-        settings = MachineSettings(
-            id=1,
-            name='Test CNC',
-            max_x=15.0,
-            max_y=15.0,
-            units='inches',
-            controller_type='mach3',
-            supports_subroutines=True,
-            supports_canned_cycles=True,
-            gcode_base_path='C:\\Mach3\\GCode'
-        )
-        db.session.add(settings)
-        db.session.commit()
-        yield settings
+    return _seed(MachineSettings(**machine_settings_data))
 
 
 @pytest.fixture
-def general_settings(app):
+def general_settings(app, general_settings_data):
     """Create general settings for testing."""
-    with app.app_context():
-        settings = GeneralSettings(
-            id=1,
-            safety_height=0.5,
-            travel_height=0.2,
-            spindle_warmup_seconds=2
-        )
-        db.session.add(settings)
-        db.session.commit()
-        yield settings
+    return _seed(GeneralSettings(**general_settings_data))
 
 
 @pytest.fixture
 def sample_tube_project(app, sample_tube_material, sample_tool):
     """Create a sample tube project for testing."""
-    with app.app_context():
-        material = Material.query.get(sample_tube_material.id)
-        tool = Tool.query.get(sample_tool.id)
-
-        project = Project(
-            name='Test Tube Project',
-            project_type='drill',
-            material_id=material.id,
-            drill_tool_id=tool.id,
-            operations={
-                'drill_holes': [
-                    {'id': 'hole1', 'type': 'single', 'x': 1.0, 'y': 0.5}
-                ],
-                'circular_cuts': [],
-                'hexagonal_cuts': [],
-                'line_cuts': []
-            },
-            tube_void_skip=True,
-            working_length=24.0,
-            tube_orientation='wide'
-        )
-        db.session.add(project)
-        db.session.commit()
-        yield project
+    return _seed(Project(
+        name='Test Tube Project',
+        project_type='drill',
+        material_id=sample_tube_material.id,
+        drill_tool_id=sample_tool.id,
+        operations={
+            'drill_holes': [
+                {'id': 'hole1', 'type': 'single', 'x': 1.0, 'y': 0.5}
+            ],
+            'circular_cuts': [],
+            'hexagonal_cuts': [],
+            'line_cuts': []
+        },
+        tube_void_skip=True,
+        working_length=24.0,
+        tube_orientation='wide'
+    ))
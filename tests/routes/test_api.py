@@ -6,14 +6,15 @@ import io
 
 from web.models import Project
 
+pytestmark = pytest.mark.db
+
 
 class TestProjectSaveAPI:
     """Tests for POST /api/projects/<id>/save endpoint."""
 
-    def test_save_project(self, client, app, sample_project):
+    def test_save_project(self, client, sample_project):
         """Test saving a project via API."""
-        with app.app_context():
-            project_id = sample_project.id
+        project_id = sample_project.id
 
         response = client.post(
             f'/api/projects/{project_id}/save',
@@ -34,6 +35,20 @@ class TestProjectSaveAPI:
         assert data['status'] == 'ok'
         assert 'modified_at' in data['data']
 
+    def test_save_project_malformed_operations(self, client, sample_project):
+        """Test saving malformed operations returns 400."""
+        project_id = sample_project.id
+
+        response = client.post(
+            f'/api/projects/{project_id}/save',
+            data=json.dumps({'operations': {'drill_holes': 'bad'}}),
+            content_type='application/json'
+        )
+
+        assert response.status_code == 400
+        data = json.loads(response.data)
+        assert data['status'] == 'error'
+
     def test_save_project_not_found(self, client):
         """Test saving non-existent project returns 404."""
         response = client.post(
@@ -46,10 +61,9 @@ class TestProjectSaveAPI:
         data = json.loads(response.data)
         assert data['status'] == 'error'
 
-    def test_save_project_no_data(self, client, app, sample_project):
+    def test_save_project_no_data(self, client, sample_project):
         """Test saving project without JSON data returns error."""
-        with app.app_context():
-            project_id = sample_project.id
+        project_id = sample_project.id
 
         response = client.post(f'/api/projects/{project_id}/save')
 
@@ -61,10 +75,9 @@ class TestProjectSaveAPI:
 class TestProjectPreviewAPI:
     """Tests for POST /api/projects/<id>/preview endpoint."""
 
-    def test_preview_project(self, client, app, sample_project, machine_settings):
+    def test_preview_project(self, client, sample_project, machine_settings):
         """Test generating SVG preview."""
-        with app.app_context():
-            project_id = sample_project.id
+        project_id = sample_project.id
 
         response = client.post(
             f'/api/projects/{project_id}/preview',
@@ -78,10 +91,9 @@ class TestProjectPreviewAPI:
         assert 'svg' in data['data']
         assert data['data']['svg'].startswith('<svg')
 
-    def test_preview_project_with_custom_operations(self, client, app, sample_project, machine_settings):
+    def test_preview_project_with_custom_operations(self, client, sample_project, machine_settings):
         """Test previewing with custom operations."""
-        with app.app_context():
-            project_id = sample_project.id
+        project_id = sample_project.id
 
         response = client.post(
             f'/api/projects/{project_id}/preview',
@@ -114,10 +126,9 @@ class TestProjectPreviewAPI:
 class TestProjectDownloadAPI:
     """Tests for GET /api/projects/<id>/download endpoint."""
 
-    def test_download_gcode(self, client, app, sample_project, machine_settings, general_settings):
+    def test_download_gcode(self, client, sample_project, machine_settings, general_settings):
         """Test downloading G-code as ZIP with main file and subroutines."""
-        with app.app_context():
-            project_id = sample_project.id
+        project_id = sample_project.id
 
         response = client.get(f'/api/projects/{project_id}/download')
 
@@ -145,19 +156,18 @@ class TestProjectDownloadAPI:
                     assert 'G-CODE GENERATION CONFIG' in config
                     assert 'RAW OPERATIONS' in config
 
-    def test_download_gcode_no_material(self, client, app, sample_tool):
+    def test_download_gcode_no_material(self, client, sample_tool):
         """Test download fails without material."""
-        with app.app_context():
-            from web.extensions import db
-            project = Project(
-                name='No Material',
-                project_type='drill',
-                drill_tool_id=sample_tool.id,
-                operations={'drill_holes': [], 'circular_cuts': [], 'hexagonal_cuts': [], 'line_cuts': []}
-            )
-            db.session.add(project)
-            db.session.commit()
-            project_id = project.id
+        from web.extensions import db
+        project = Project(
+            name='No Material',
+            project_type='drill',
+            drill_tool_id=sample_tool.id,
+            operations={'drill_holes': [], 'circular_cuts': [], 'hexagonal_cuts': [], 'line_cuts': []}
+        )
+        db.session.add(project)
+        db.session.commit()
+        project_id = project.id
 
         response = client.get(f'/api/projects/{project_id}/download')
 
@@ -165,19 +175,18 @@ class TestProjectDownloadAPI:
         data = json.loads(response.data)
         assert 'material' in data['message'].lower()
 
-    def test_download_gcode_no_drill_tool(self, client, app, sample_material):
+    def test_download_gcode_no_drill_tool(self, client, sample_material):
         """Test download fails without drill tool for drill project."""
-        with app.app_context():
-            from web.extensions import db
-            project = Project(
-                name='No Tool',
-                project_type='drill',
-                material_id=sample_material.id,
-                operations={'drill_holes': [], 'circular_cuts': [], 'hexagonal_cuts': [], 'line_cuts': []}
-            )
-            db.session.add(project)
-            db.session.commit()
-            project_id = project.id
+        from web.extensions import db
+        project = Project(
+            name='No Tool',
+            project_type='drill',
+            material_id=sample_material.id,
+            operations={'drill_holes': [], 'circular_cuts': [], 'hexagonal_cuts': [], 'line_cuts': []}
+        )
+        db.session.add(project)
+        db.session.commit()
+        project_id = project.id
 
         response = client.get(f'/api/projects/{project_id}/download')
 
@@ -195,10 +204,9 @@ class TestProjectDownloadAPI:
 class TestProjectValidateAPI:
     """Tests for POST /api/projects/<id>/validate endpoint."""
 
-    def test_validate_valid_project(self, client, app, sample_project, machine_settings):
+    def test_validate_valid_project(self, client, sample_project, machine_settings):
         """Test validating a valid project."""
-        with app.app_context():
-            project_id = sample_project.id
+        project_id = sample_project.id
 
         response = client.post(f'/api/projects/{project_id}/validate')
 
@@ -207,18 +215,17 @@ class TestProjectValidateAPI:
         assert data['valid'] is True
         assert data['errors'] == []
 
-    def test_validate_invalid_project(self, client, app, machine_settings):
+    def test_validate_invalid_project(self, client, machine_settings):
         """Test validating an invalid project returns errors."""
-        with app.app_context():
-            from web.extensions import db
-            project = Project(
-                name='Invalid Project',
-                project_type='drill',
-                operations={'drill_holes': [], 'circular_cuts': [], 'hexagonal_cuts': [], 'line_cuts': []}
-            )
-            db.session.add(project)
-            db.session.commit()
-            project_id = project.id
+        from web.extensions import db
+        project = Project(
+            name='Invalid Project',
+            project_type='drill',
+            operations={'drill_holes': [], 'circular_cuts': [], 'hexagonal_cuts': [], 'line_cuts': []}
+        )
+        db.session.add(project)
+        db.session.commit()
+        project_id = project.id
 
         response = client.post(f'/api/projects/{project_id}/validate')
 
@@ -237,10 +244,9 @@ class TestProjectValidateAPI:
 class TestMaterialGCodeParamsAPI:
     """Tests for GET /api/materials/<id>/gcode-params endpoint."""
 
-    def test_get_gcode_params(self, client, app, sample_material):
+    def test_get_gcode_params(self, client, sample_material):
         """Test getting G-code params for a material."""
-        with app.app_context():
-            material_id = sample_material.id
+        material_id = sample_material.id
 
         response = client.get(f'/api/materials/{material_id}/gcode-params')
 
@@ -1,4 +1,6 @@
 """Tests for src/gcode_generator.py module."""
+from dataclasses import FrozenInstanceError, asdict, replace
+
 import pytest
 
 from src.gcode_generator import (
@@ -9,7 +11,7 @@ from src.gcode_generator import (
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def generation_settings():
     """Create test generation settings."""
     return GenerationSettings(
@@ -24,7 +26,7 @@ def generation_settings():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def drill_params():
     """Create test drill parameters."""
     return ToolParams(
@@ -36,7 +38,7 @@ def drill_params():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def cut_params():
     """Create test cut parameters."""
     return ToolParams(
@@ -48,14 +50,35 @@ def cut_params():
     )
 
 
+@pytest.fixture(scope="module")
+def new_generator(generation_settings):
+    """Return a factory that builds a fresh generator per call."""
+    def factory(project_name, material_depth=0.125, settings=None):
+        return WebGCodeGenerator(
+            settings=settings or generation_settings,
+            project_name=project_name,
+            material_depth=material_depth
+        )
+    return factory
+
+
 class TestGenerationSettings:
     """Tests for GenerationSettings dataclass."""
 
     def test_settings_creation(self, generation_settings):
         """Test creating generation settings."""
-        assert generation_settings.safety_height == 0.5
-        assert generation_settings.supports_subroutines is True
-        assert generation_settings.gcode_base_path == "C:\\Mach3\\GCode"
+        expected = {
+            'safety_height': 0.5,
+            'supports_subroutines': True,
+            'gcode_base_path': "C:\\Mach3\\GCode",
+        }
+        assert expected.items() <= asdict(generation_settings).items()
+
+    def test_settings_frozen_and_hashable(self, generation_settings):
+        """Test settings cannot be mutated and can key a cache."""
+        with pytest.raises(FrozenInstanceError):
+            generation_settings.supports_subroutines = False
+        assert hash(generation_settings) == hash(replace(generation_settings))
 
 
 class TestToolParams:
@@ -63,54 +86,51 @@ class TestToolParams:
 
     def test_drill_params(self, drill_params):
         """Test drill parameters."""
-        assert drill_params.spindle_speed == 1000
-        assert drill_params.pecking_depth == 0.05
-        assert drill_params.pass_depth is None
+        assert asdict(drill_params) == {
+            'spindle_speed': 1000,
+            'feed_rate': 2.0,
+            'plunge_rate': 1.0,
+            'pecking_depth': 0.05,
+            'pass_depth': None,
+            'tool_diameter': 0.125,
+        }
 
     def test_cut_params(self, cut_params):
         """Test cut parameters."""
-        assert cut_params.spindle_speed == 12000
-        assert cut_params.pass_depth == 0.025
-        assert cut_params.pecking_depth is None
+        assert asdict(cut_params) == {
+            'spindle_speed': 12000,
+            'feed_rate': 12.0,
+            'plunge_rate': 2.0,
+            'pecking_depth': None,
+            'pass_depth': 0.025,
+            'tool_diameter': 0.125,
+        }
 
 
 class TestWebGCodeGenerator:
     """Tests for WebGCodeGenerator class."""
 
-    def test_generator_initialization(self, generation_settings):
+    def test_generator_initialization(self, new_generator):
         """Test generator initialization."""
-        generator = WebGCodeGenerator(
-            settings=generation_settings,
-            project_name="Test Project",
-            material_depth=0.125
-        )
+        generator = new_generator("Test Project")
         assert generator.project_name == "Test_Project"  # Sanitized
         assert generator.material_depth == 0.125
         assert generator.subroutines == {}
 
-    def test_project_name_sanitization(self, generation_settings):
+    def test_project_name_sanitization(self, new_generator):
         """Test that project name is sanitized."""
-        generator = WebGCodeGenerator(
-            settings=generation_settings,
-            project_name="My Test@#$ Project!",
-            material_depth=0.125
-        )
+        generator = new_generator("My Test@#$ Project!")
         assert generator.project_name == "My_Test_Project"
 
 
 class TestDrillGCodeGeneration:
     """Tests for drill G-code generation."""
 
-    def test_generate_drill_inline(self, generation_settings, drill_params):
+    def test_generate_drill_inline(self, generation_settings, new_generator, drill_params):
         """Test inline drill generation."""
         # Disable subroutines for inline test
-        generation_settings.supports_subroutines = False
-
-        generator = WebGCodeGenerator(
-            settings=generation_settings,
-            project_name="DrillTest",
-            material_depth=0.125
-        )
+        inline_settings = replace(generation_settings, supports_subroutines=False)
+        generator = new_generator("DrillTest", settings=inline_settings)
 
         drill_points = [(1.0, 1.0), (2.0, 2.0)]
         lines = generator.generate_drill_gcode(drill_points, drill_params)
@@ -122,13 +142,9 @@ class TestDrillGCodeGeneration:
         assert 'X1.0000' in gcode
         assert 'X2.0000' in gcode
 
-    def test_generate_drill_with_subroutines(self, generation_settings, drill_params):
+    def test_generate_drill_with_subroutines(self, new_generator, drill_params):
         """Test drill generation with subroutines."""
-        generator = WebGCodeGenerator(
-            settings=generation_settings,
-            project_name="DrillTest",
-            material_depth=0.125
-        )
+        generator = new_generator("DrillTest")
 
         drill_points = [(1.0, 1.0), (1.5, 1.0), (2.0, 1.0)]
         operations = [{
@@ -145,30 +161,15 @@ class TestDrillGCodeGeneration:
         # Should have generated a subroutine
         assert len(generator.subroutines) > 0
 
-    def test_empty_drill_points(self, generation_settings, drill_params):
-        """Test with no drill points."""
-        generator = WebGCodeGenerator(
-            settings=generation_settings,
-            project_name="DrillTest",
-            material_depth=0.125
-        )
-
-        lines = generator.generate_drill_gcode([], drill_params)
-        assert lines == []
-
 
 class TestCircularGCodeGeneration:
     """Tests for circular cut G-code generation."""
 
-    def test_generate_circular_inline(self, generation_settings, cut_params):
+    def test_generate_circular_inline(self, generation_settings, new_generator, cut_params):
         """Test inline circular cut generation."""
-        generation_settings.supports_subroutines = False
-
-        generator = WebGCodeGenerator(
-            settings=generation_settings,
-            project_name="CircleTest",
-            material_depth=0.125
-        )
+        # Disable subroutines for inline test
+        inline_settings = replace(generation_settings, supports_subroutines=False)
+        generator = new_generator("CircleTest", settings=inline_settings)
 
         circles = [{'center_x': 5.0, 'center_y': 5.0, 'diameter': 1.0}]
         lines = generator.generate_circular_gcode(circles, cut_params)
@@ -179,13 +180,9 @@ class TestCircularGCodeGeneration:
         # Should have I offset (negative cut radius)
         assert 'I' in gcode
 
-    def test_generate_circular_with_subroutines(self, generation_settings, cut_params):
+    def test_generate_circular_with_subroutines(self, new_generator, cut_params):
         """Test circular cut with subroutines."""
-        generator = WebGCodeGenerator(
-            settings=generation_settings,
-            project_name="CircleTest",
-            material_depth=0.125
-        )
+        generator = new_generator("CircleTest")
 
         circles = [
             {'center_x': 5.0, 'center_y': 5.0, 'diameter': 1.0},
@@ -199,30 +196,15 @@ class TestCircularGCodeGeneration:
         # Should have subroutine
         assert len(generator.subroutines) > 0
 
-    def test_empty_circles(self, generation_settings, cut_params):
-        """Test with no circles."""
-        generator = WebGCodeGenerator(
-            settings=generation_settings,
-            project_name="CircleTest",
-            material_depth=0.125
-        )
-
-        lines = generator.generate_circular_gcode([], cut_params)
-        assert lines == []
-
 
 class TestHexagonalGCodeGeneration:
     """Tests for hexagonal cut G-code generation."""
 
-    def test_generate_hexagonal_inline(self, generation_settings, cut_params):
+    def test_generate_hexagonal_inline(self, generation_settings, new_generator, cut_params):
         """Test inline hexagonal cut generation."""
-        generation_settings.supports_subroutines = False
-
-        generator = WebGCodeGenerator(
-            settings=generation_settings,
-            project_name="HexTest",
-            material_depth=0.125
-        )
+        # Disable subroutines for inline test
+        inline_settings = replace(generation_settings, supports_subroutines=False)
+        generator = new_generator("HexTest", settings=inline_settings)
 
         hexagons = [{'center_x': 5.0, 'center_y': 5.0, 'flat_to_flat': 0.75}]
         lines = generator.generate_hexagonal_gcode(hexagons, cut_params)
@@ -231,13 +213,9 @@ class TestHexagonalGCodeGeneration:
         # Should contain linear moves (G01) for hexagon sides
         assert 'G01' in gcode
 
-    def test_generate_hexagonal_with_subroutines(self, generation_settings, cut_params):
+    def test_generate_hexagonal_with_subroutines(self, new_generator, cut_params):
         """Test hexagonal cut with subroutines."""
-        generator = WebGCodeGenerator(
-            settings=generation_settings,
-            project_name="HexTest",
-            material_depth=0.125
-        )
+        generator = new_generator("HexTest")
 
         hexagons = [
             {'center_x': 5.0, 'center_y': 5.0, 'flat_to_flat': 0.75},
@@ -249,30 +227,15 @@ class TestHexagonalGCodeGeneration:
         assert 'M98' in gcode
         assert len(generator.subroutines) > 0
 
-    def test_empty_hexagons(self, generation_settings, cut_params):
-        """Test with no hexagons."""
-        generator = WebGCodeGenerator(
-            settings=generation_settings,
-            project_name="HexTest",
-            material_depth=0.125
-        )
-
-        lines = generator.generate_hexagonal_gcode([], cut_params)
-        assert lines == []
-
 
 class TestLineGCodeGeneration:
     """Tests for line cut G-code generation."""
 
-    def test_generate_line_inline(self, generation_settings, cut_params):
+    def test_generate_line_inline(self, generation_settings, new_generator, cut_params):
         """Test inline line cut generation."""
-        generation_settings.supports_subroutines = False
-
-        generator = WebGCodeGenerator(
-            settings=generation_settings,
-            project_name="LineTest",
-            material_depth=0.125
-        )
+        # Disable subroutines for inline test
+        inline_settings = replace(generation_settings, supports_subroutines=False)
+        generator = new_generator("LineTest", settings=inline_settings)
 
         line_cuts = [{
             'points': [
@@ -289,15 +252,11 @@ class TestLineGCodeGeneration:
         assert 'X1.0000' in gcode
         assert 'Y1.0000' in gcode
 
-    def test_generate_line_with_arc(self, generation_settings, cut_params):
+    def test_generate_line_with_arc(self, generation_settings, new_generator, cut_params):
         """Test line cut with arc segment."""
-        generation_settings.supports_subroutines = False
-
-        generator = WebGCodeGenerator(
-            settings=generation_settings,
-            project_name="LineTest",
-            material_depth=0.125
-        )
+        # Disable subroutines for inline test
+        inline_settings = replace(generation_settings, supports_subroutines=False)
+        generator = new_generator("LineTest", settings=inline_settings)
 
         line_cuts = [{
             'points': [
@@ -314,137 +273,88 @@ class TestLineGCodeGeneration:
         assert 'I' in gcode
         assert 'J' in gcode
 
-    def test_empty_line_cuts(self, generation_settings, cut_params):
-        """Test with no line cuts."""
-        generator = WebGCodeGenerator(
-            settings=generation_settings,
-            project_name="LineTest",
-            material_depth=0.125
-        )
 
-        lines = generator.generate_line_gcode([], cut_params)
-        assert lines == []
+class TestEmptyInputs:
+    """Tests that every generator method returns nothing for empty input."""
 
+    @pytest.mark.parametrize("method_name,params_fixture", [
+        ("generate_drill_gcode", "drill_params"),
+        ("generate_circular_gcode", "cut_params"),
+        ("generate_hexagonal_gcode", "cut_params"),
+        ("generate_line_gcode", "cut_params"),
+    ])
+    def test_empty_input(self, new_generator, request, method_name, params_fixture):
+        """Test with no geometry for the given operation type."""
+        params = request.getfixturevalue(params_fixture)
+        lines = getattr(new_generator("EmptyTest"), method_name)([], params)
+        assert lines == []
 
-class TestFullGeneration:
-    """Tests for complete G-code generation."""
 
-    def test_generate_complete(self, generation_settings, drill_params):
-        """Test complete G-code generation."""
-        generator = WebGCodeGenerator(
-            settings=generation_settings,
-            project_name="FullTest",
-            material_depth=0.125
-        )
+@pytest.fixture(scope="module")
+def full_result(new_generator, drill_params, cut_params):
+    """Run one complete generation with both drill and circular operations."""
+    generator = new_generator("FullTest")
+
+    expanded_ops = {
+        'drill_points': [(1.0, 1.0), (2.0, 2.0)],
+        'circular_cuts': [{'center_x': 5.0, 'center_y': 5.0, 'diameter': 1.0}],
+        'hexagonal_cuts': [],
+        'line_cuts': []
+    }
+    original_ops = {
+        'drill_holes': [
+            {'id': 'h1', 'type': 'single', 'x': 1.0, 'y': 1.0},
+            {'id': 'h2', 'type': 'single', 'x': 2.0, 'y': 2.0}
+        ]
+    }
 
-        expanded_ops = {
-            'drill_points': [(1.0, 1.0), (2.0, 2.0)],
-            'circular_cuts': [],
-            'hexagonal_cuts': [],
-            'line_cuts': []
-        }
-        original_ops = {
-            'drill_holes': [
-                {'id': 'h1', 'type': 'single', 'x': 1.0, 'y': 1.0},
-                {'id': 'h2', 'type': 'single', 'x': 2.0, 'y': 2.0}
-            ]
-        }
+    return generator.generate(
+        expanded_ops=expanded_ops,
+        drill_params=drill_params,
+        cut_params=cut_params,
+        original_operations=original_ops
+    )
 
-        result = generator.generate(
-            expanded_ops=expanded_ops,
-            drill_params=drill_params,
-            original_operations=original_ops
-        )
 
-        assert isinstance(result, GenerationResult)
-        assert result.main_gcode is not None
-        assert 'G20 G90' in result.main_gcode  # Header
-        assert 'M03' in result.main_gcode  # Spindle on
-        assert 'M05' in result.main_gcode  # Spindle off
-        assert 'M30' in result.main_gcode  # Program end
+class TestFullGeneration:
+    """Tests for complete G-code generation."""
 
-    def test_generate_result_structure(self, generation_settings, drill_params):
+    def test_generate_complete(self, full_result):
+        """Test complete G-code generation."""
+        assert isinstance(full_result, GenerationResult)
+        assert full_result.main_gcode is not None
+        assert 'G20 G90' in full_result.main_gcode  # Header
+        assert 'M03' in full_result.main_gcode  # Spindle on
+        assert 'M05' in full_result.main_gcode  # Spindle off
+        assert 'M30' in full_result.main_gcode  # Program end
+
+    def test_generate_result_structure(self, full_result):
         """Test GenerationResult structure."""
-        generator = WebGCodeGenerator(
-            settings=generation_settings,
-            project_name="ResultTest",
-            material_depth=0.125
-        )
-
-        expanded_ops = {
-            'drill_points': [(1.0, 1.0)],
-            'circular_cuts': [],
-            'hexagonal_cuts': [],
-            'line_cuts': []
-        }
-
-        result = generator.generate(
-            expanded_ops=expanded_ops,
-            drill_params=drill_params
-        )
-
-        assert hasattr(result, 'main_gcode')
-        assert hasattr(result, 'subroutines')
-        assert hasattr(result, 'project_name')
-        assert hasattr(result, 'warnings')
-        assert isinstance(result.subroutines, dict)
-        assert isinstance(result.warnings, list)
-
-    def test_generate_no_comments(self, generation_settings, drill_params):
+        assert hasattr(full_result, 'main_gcode')
+        assert hasattr(full_result, 'subroutines')
+        assert hasattr(full_result, 'project_name')
+        assert hasattr(full_result, 'warnings')
+        assert isinstance(full_result.subroutines, dict)
+        assert isinstance(full_result.warnings, list)
+
+    def test_generate_no_comments(self, full_result):
         """Test that generated G-code has no comments (for Mach3)."""
-        generator = WebGCodeGenerator(
-            settings=generation_settings,
-            project_name="NoCommentTest",
-            material_depth=0.125
-        )
-
-        expanded_ops = {
-            'drill_points': [(1.0, 1.0)],
-            'circular_cuts': [],
-            'hexagonal_cuts': [],
-            'line_cuts': []
-        }
-
-        result = generator.generate(
-            expanded_ops=expanded_ops,
-            drill_params=drill_params
-        )
-
         # Should not have semicolon or parenthesis comments
         # (except in M98 calls which have required parenthesis syntax)
-        lines = result.main_gcode.split('\n')
-        for line in lines:
-            if 'M98' not in line:
-                assert ';' not in line
-                assert '(' not in line
+        violation = next((
+            line for line in full_result.main_gcode.splitlines()
+            if 'M98' not in line and (';' in line or '(' in line)
+        ), None)
+        assert violation is None, violation
 
-    def test_generate_with_mixed_operations(self, generation_settings, drill_params, cut_params):
+    def test_generate_with_mixed_operations(self, full_result):
         """Test generation with both drill and cut operations."""
-        generator = WebGCodeGenerator(
-            settings=generation_settings,
-            project_name="MixedTest",
-            material_depth=0.125
-        )
-
-        expanded_ops = {
-            'drill_points': [(1.0, 1.0)],
-            'circular_cuts': [{'center_x': 5.0, 'center_y': 5.0, 'diameter': 1.0}],
-            'hexagonal_cuts': [],
-            'line_cuts': []
-        }
-
-        result = generator.generate(
-            expanded_ops=expanded_ops,
-            drill_params=drill_params,
-            cut_params=cut_params
-        )
-
-        assert result.main_gcode is not None
+        assert full_result.main_gcode is not None
         # Should have drill operations in main code
-        assert 'G01' in result.main_gcode  # Feed moves for drilling
+        assert 'G01' in full_result.main_gcode  # Feed moves for drilling
         # Circle arc is in subroutine when subroutines are enabled
-        assert 'M98' in result.main_gcode  # Subroutine call for circle
+        assert 'M98' in full_result.main_gcode  # Subroutine call for circle
         # The G02 arc is in the subroutine
-        assert len(result.subroutines) > 0
-        subroutine_content = list(result.subroutines.values())[0]
+        assert len(full_result.subroutines) > 0
+        subroutine_content = list(full_result.subroutines.values())[0]
         assert 'G02' in subroutine_content  # Arc in subroutine
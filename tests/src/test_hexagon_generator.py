@@ -13,40 +13,42 @@ from src.hexagon_generator import (
 class TestCalculateHexagonVertices:
     """Tests for calculate_hexagon_vertices function."""
 
-    def test_vertex_count(self):
+    @pytest.fixture(scope="class")
+    def unit_hex(self):
+        """Vertices of a unit hexagon at the origin, shared by the class."""
+        return calculate_hexagon_vertices(0, 0, 1.0)
+
+    def test_vertex_count(self, unit_hex):
         """Test that exactly 6 vertices are returned."""
-        vertices = calculate_hexagon_vertices(0, 0, 1.0)
-        assert len(vertices) == 6
+        assert len(unit_hex) == 6
 
-    def test_point_up_orientation(self):
+    def test_point_up_orientation(self, unit_hex):
         """Test that hexagon is point-up (top vertex on Y axis)."""
-        vertices = calculate_hexagon_vertices(0, 0, 1.0)
-        top_vertex = vertices[0]
+        top_vertex = unit_hex[0]
         # Top vertex should have X=0 (on Y axis)
         assert abs(top_vertex[0]) < 1e-10
 
-    def test_top_vertex_is_highest(self):
+    def test_top_vertex_is_highest(self, unit_hex):
         """Test that first vertex (top) has highest Y."""
-        vertices = calculate_hexagon_vertices(0, 0, 1.0)
-        top_y = vertices[0][1]
-        for v in vertices[1:]:
+        top_y = unit_hex[0][1]
+        for v in unit_hex[1:]:
             assert v[1] <= top_y + 1e-10
 
-    def test_bottom_vertex(self):
+    def test_bottom_vertex(self, unit_hex):
         """Test that bottom vertex (index 3) is on Y axis."""
-        vertices = calculate_hexagon_vertices(0, 0, 1.0)
-        bottom_vertex = vertices[3]
+        bottom_vertex = unit_hex[3]
         assert abs(bottom_vertex[0]) < 1e-10
 
     def test_circumradius(self):
         """Test that vertices are at correct distance from center."""
         flat_to_flat = 1.0
-        expected_circumradius = flat_to_flat / math.sqrt(3)
+        expected_sq = (flat_to_flat / math.sqrt(3))**2
         vertices = calculate_hexagon_vertices(5.0, 5.0, flat_to_flat)
 
+        # Compare squared distances to avoid a sqrt per vertex
         for vx, vy in vertices:
-            dist = math.sqrt((vx - 5.0)**2 + (vy - 5.0)**2)
-            assert abs(dist - expected_circumradius) < 1e-10
+            dist_sq = (vx - 5.0)**2 + (vy - 5.0)**2
+            assert abs(dist_sq - expected_sq) < 1e-10
 
     def test_offset_center(self):
         """Test with offset center."""
@@ -60,17 +62,15 @@ class TestCalculateHexagonVertices:
         assert abs(avg_x - center_x) < 1e-10
         assert abs(avg_y - center_y) < 1e-10
 
-    def test_clockwise_order(self):
+    def test_clockwise_order(self, unit_hex):
         """Test vertices are in clockwise order from top."""
-        vertices = calculate_hexagon_vertices(0, 0, 1.0)
-
         # First vertex should be top (highest Y)
         # Moving clockwise, Y should generally decrease for first 3 vertices
-        assert vertices[0][1] > vertices[1][1]  # top > upper right
-        assert vertices[1][1] > vertices[2][1]  # upper right > lower right
+        assert unit_hex[0][1] > unit_hex[1][1]  # top > upper right
+        assert unit_hex[1][1] > unit_hex[2][1]  # upper right > lower right
         # Then should increase for last 3
-        assert vertices[3][1] < vertices[4][1]  # bottom < lower left
-        assert vertices[4][1] < vertices[5][1]  # lower left < upper left
+        assert unit_hex[3][1] < unit_hex[4][1]  # bottom < lower left
+        assert unit_hex[4][1] < unit_hex[5][1]  # lower left < upper left
 
 
 class TestCalculateCompensatedVertices:
@@ -91,9 +91,9 @@ class TestCalculateCompensatedVertices:
         compensated = calculate_compensated_vertices(center_x, center_y, flat_to_flat, tool_diameter)
 
         for (rx, ry), (cx, cy) in zip(regular, compensated):
-            reg_dist = math.sqrt((rx - center_x)**2 + (ry - center_y)**2)
-            comp_dist = math.sqrt((cx - center_x)**2 + (cy - center_y)**2)
-            assert comp_dist < reg_dist
+            reg_dist_sq = (rx - center_x)**2 + (ry - center_y)**2
+            comp_dist_sq = (cx - center_x)**2 + (cy - center_y)**2
+            assert comp_dist_sq < reg_dist_sq
 
     def test_offset_amount(self):
         """Test that offset is correct for tool radius."""
@@ -105,12 +105,15 @@ class TestCalculateCompensatedVertices:
         regular = calculate_hexagon_vertices(0, 0, 2.0)
         compensated = calculate_compensated_vertices(0, 0, 2.0, tool_diameter)
 
-        # Check offset for top vertex
-        reg_dist = math.sqrt(regular[0][0]**2 + regular[0][1]**2)
-        comp_dist = math.sqrt(compensated[0][0]**2 + compensated[0][1]**2)
+        # Check offset for top vertex: it sits at circumradius - offset,
+        # compared as squared distances
+        expected_dist_sq = (2.0 / math.sqrt(3) - expected_offset)**2
+        comp_dist_sq = compensated[0][0]**2 + compensated[0][1]**2
+        assert abs(comp_dist_sq - expected_dist_sq) < 1e-10
 
-        actual_offset = reg_dist - comp_dist
-        assert abs(actual_offset - expected_offset) < 1e-10
+        # Regular top vertex stays at the circumradius
+        reg_dist_sq = regular[0][0]**2 + regular[0][1]**2
+        assert abs(reg_dist_sq - (2.0 / math.sqrt(3))**2) < 1e-10
 
     def test_zero_tool_diameter(self):
         """Test with zero tool diameter (no compensation)."""
@@ -3,6 +3,7 @@ import math
 import pytest
 
 from src.utils.lead_in import (
+    _approach_unit_vector,
     _user_angle_to_math_angle,
     calculate_circle_lead_in_point,
     calculate_helix_start_point,
@@ -45,6 +46,27 @@ class TestAngleConversion:
         assert abs(result - math.pi / 4) < 0.0001
 
 
+class TestApproachUnitVector:
+    """Tests for _approach_unit_vector() function."""
+
+    @pytest.mark.parametrize("angle,expected", [
+        (0, (0.0, 1.0)),
+        (90, (1.0, 0.0)),
+        (180, (0.0, -1.0)),
+        (270, (-1.0, 0.0)),
+    ])
+    def test_cardinal_directions(self, angle, expected):
+        """Cardinal approach angles map to unit vectors."""
+        cos_a, sin_a = _approach_unit_vector(angle)
+        assert abs(cos_a - expected[0]) < 0.0001
+        assert abs(sin_a - expected[1]) < 0.0001
+
+    def test_matches_angle_conversion(self):
+        """Cached vector matches cos/sin of the converted angle."""
+        math_angle = _user_angle_to_math_angle(37.5)
+        assert _approach_unit_vector(37.5) == (math.cos(math_angle), math.sin(math_angle))
+
+
 class TestCircleLeadInPoint:
     """Tests for calculate_circle_lead_in_point() with approach angle."""
 
@@ -137,6 +137,72 @@ class TestSafetyCoordinator:
 
         assert result == 100.0
 
+    def test_compile_skips_disabled_adjusters(self):
+        """Compiled chain only contains enabled adjusters."""
+        coordinator = SafetyCoordinator()
+        settings = MockSettings(first_pass_feed_factor=1.0, arc_slowdown_enabled=False)
+        coordinator.register(FirstPassAdjuster(settings))
+        coordinator.register(CornerSlowdownAdjuster(settings))
+        coordinator.register(ArcSlowdownAdjuster(settings))
+
+        chain = coordinator.compile()
+
+        assert len(chain) == 1
+        assert len(coordinator.adjusters) == 3
+
+    def test_register_after_use_recompiles(self):
+        """Adjusters registered after a feed lookup are still applied."""
+        coordinator = SafetyCoordinator()
+        settings = MockSettings(first_pass_feed_factor=0.7, arc_feed_factor=0.8)
+        coordinator.register(FirstPassAdjuster(settings))
+        context = FeedContext(base_feed=100.0, pass_num=0, is_arc=True)
+
+        assert coordinator.get_adjusted_feed(100.0, context) == pytest.approx(70.0)
+
+        coordinator.register(ArcSlowdownAdjuster(settings))
+
+        assert coordinator.get_adjusted_feed(100.0, context) == pytest.approx(56.0)
+
+    def test_direct_adjusters_append_is_applied(self):
+        """Adjusters appended to the list directly are still applied."""
+        coordinator = SafetyCoordinator()
+        settings = MockSettings(first_pass_feed_factor=0.7, arc_feed_factor=0.8)
+        coordinator.register(FirstPassAdjuster(settings))
+        context = FeedContext(base_feed=100.0, pass_num=0, is_arc=True)
+
+        assert coordinator.get_adjusted_feed(100.0, context) == pytest.approx(70.0)
+
+        coordinator.adjusters.append(ArcSlowdownAdjuster(settings))
+
+        assert coordinator.get_adjusted_feed(100.0, context) == pytest.approx(56.0)
+
+    def test_settings_changed_in_place_are_applied(self):
+        """Toggling an adjuster's settings after use takes effect."""
+        coordinator = SafetyCoordinator()
+        settings = MockSettings(arc_feed_factor=0.8, arc_slowdown_enabled=False)
+        coordinator.register(ArcSlowdownAdjuster(settings))
+        context = FeedContext(base_feed=100.0, pass_num=1, is_arc=True)
+
+        assert coordinator.get_adjusted_feed(100.0, context) == 100.0
+
+        settings.arc_slowdown_enabled = True
+
+        assert coordinator.get_adjusted_feed(100.0, context) == pytest.approx(80.0)
+
+    def test_get_adjusted_feeds_matches_scalar(self):
+        """Batch feeds equal per-context get_adjusted_feed results."""
+        coordinator = create_safety_coordinator(MockSettings())
+        contexts = [
+            FeedContext(base_feed=100.0, pass_num=0),
+            FeedContext(base_feed=100.0, pass_num=1, is_arc=True),
+            FeedContext(base_feed=100.0, pass_num=0, is_arc=True, corner_factor=0.5),
+            FeedContext(base_feed=100.0, pass_num=2, corner_factor=0.8),
+        ]
+
+        result = coordinator.get_adjusted_feeds(100.0, contexts)
+
+        assert result == [coordinator.get_adjusted_feed(100.0, c) for c in contexts]
+
 
 class TestCreateSafetyCoordinator:
     """Tests for create_safety_coordinator factory function."""
@@ -169,6 +235,17 @@ class TestCreateSafetyCoordinator:
 
         assert isinstance(coordinator.adjusters[2], ArcSlowdownAdjuster)
 
+    def test_each_call_returns_independent_coordinator(self):
+        """Registering on one coordinator does not affect another."""
+        settings = MockSettings()
+        first = create_safety_coordinator(settings)
+        second = create_safety_coordinator(settings)
+
+        first.register(ArcSlowdownAdjuster(settings))
+
+        assert first is not second
+        assert len(second.adjusters) == 3
+
     def test_coordinator_applies_all_enabled(self):
         """Created coordinator applies all enabled adjusters."""
         settings = MockSettings(
@@ -52,6 +52,13 @@ class TestCalculateArcAngularSpan:
         span = calculate_arc_angular_span(4, 1, 6, 1, 5, 4, clockwise=True)
         assert 315 < span < 330  # Approximately 323°
 
+    def test_start_at_center_uses_end_angle(self):
+        """Zero-radius start measures the span from angle 0 to the end point."""
+        span = calculate_arc_angular_span(0, 0, 0, 1, 0, 0, clockwise=False)
+        assert abs(span - 90) < 0.1
+        span = calculate_arc_angular_span(0, 0, 0, 1, 0, 0, clockwise=True)
+        assert abs(span - 270) < 0.1
+
 
 class TestCalculateSvgArcFlags:
     """Tests for calculate_svg_arc_flags function."""
@@ -1,6 +1,6 @@
 """Tests for src/tube_void_checker.py module."""
 import pytest
-from unittest.mock import MagicMock
+from collections import namedtuple
 
 from src.tube_void_checker import (
     calculate_void_bounds,
@@ -13,6 +13,12 @@ from src.tube_void_checker import (
     filter_operations_for_tube
 )
 
+# Stand-in for the Material model: only the attributes the filter reads
+Material = namedtuple(
+    'Material', 'form outer_width outer_height wall_thickness',
+    defaults=(None, None, None)
+)
+
 
 class TestCalculateVoidBounds:
     """Tests for calculate_void_bounds function."""
@@ -105,6 +111,18 @@ class TestHexagonInVoid:
         # Large hexagon extends to wall
         assert hexagon_in_void(1.0, 0.5, 1.0, bounds) is False
 
+    def test_hexagon_circumradius_must_clear_x_walls(self):
+        """Containment is conservative: the circumradius is checked in X too."""
+        bounds = (0.125, 0.125, 1.875, 0.875)
+        # Apothem 0.3 clears x_min, circumradius (~0.346) does not
+        assert hexagon_in_void(0.445, 0.5, 0.6, bounds) is False
+
+    def test_hexagon_points_reach_y_walls(self):
+        """Points face Y, so the circumradius has to clear the Y walls."""
+        bounds = (0.125, 0.125, 1.875, 0.875)
+        # Apothem 0.3 would clear y_min, circumradius (~0.346) does not
+        assert hexagon_in_void(1.0, 0.445, 0.6, bounds) is False
+
 
 class TestFilterDrillPoints:
     """Tests for filter_drill_points function."""
@@ -173,14 +191,27 @@ class TestFilterHexagonalCuts:
         assert len(valid) == 1
         assert len(skipped) == 1
 
+    def test_filter_matches_hexagon_in_void(self):
+        """Filtering uses the same circumradius test as hexagon_in_void."""
+        bounds = (0.125, 0.125, 1.875, 0.875)
+        cuts = [
+            {'center_x': 0.445, 'center_y': 0.5, 'flat_to_flat': 0.6},
+            {'center_x': 1.0, 'center_y': 0.445, 'flat_to_flat': 0.6},
+        ]
+        valid, skipped = filter_hexagonal_cuts(cuts, bounds, 0.125)
+
+        assert valid == cuts
+        assert skipped == []
+        for cut in cuts:
+            assert hexagon_in_void(cut['center_x'], cut['center_y'], cut['flat_to_flat'], bounds) is False
+
 
 class TestFilterOperationsForTube:
     """Tests for filter_operations_for_tube function."""
 
     def test_filter_for_sheet_material_passthrough(self):
         """Test that sheet material passes through unchanged."""
-        material = MagicMock()
-        material.form = 'sheet'
+        material = Material(form='sheet')
 
         expanded_ops = {
             'drill_points': [(1.0, 1.0)],
@@ -198,11 +229,9 @@ class TestFilterOperationsForTube:
 
     def test_filter_for_tube_material(self):
         """Test filtering for tube material."""
-        material = MagicMock()
-        material.form = 'tube'
-        material.outer_width = 2.0
-        material.outer_height = 1.0
-        material.wall_thickness = 0.125
+        material = Material(
+            form='tube', outer_width=2.0, outer_height=1.0, wall_thickness=0.125
+        )
 
         expanded_ops = {
             'drill_points': [
@@ -225,11 +254,9 @@ class TestFilterOperationsForTube:
 
     def test_line_cuts_not_filtered(self):
         """Test that line cuts are never filtered."""
-        material = MagicMock()
-        material.form = 'tube'
-        material.outer_width = 2.0
-        material.outer_height = 1.0
-        material.wall_thickness = 0.125
+        material = Material(
+            form='tube', outer_width=2.0, outer_height=1.0, wall_thickness=0.125
+        )
 
         line_cut = {'id': 'l1', 'points': [{'x': 1.0, 'y': 0.5}]}
         expanded_ops = {
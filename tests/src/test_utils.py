@@ -67,10 +67,29 @@ from src.utils.validators import (
     validate_hexagon_bounds,
     validate_arc_geometry,
     validate_stepdown,
-    validate_feed_rates
+    validate_feed_rates,
+    validate_operations_structure
 )
 
 
+@pytest.fixture(scope="module")
+def ccw_unit_square():
+    """1x1 CCW square at the origin with an explicit closing point."""
+    return [
+        {'x': 0, 'y': 0, 'line_type': 'start'},
+        {'x': 1, 'y': 0, 'line_type': 'straight'},
+        {'x': 1, 'y': 1, 'line_type': 'straight'},
+        {'x': 0, 'y': 1, 'line_type': 'straight'},
+        {'x': 0, 'y': 0, 'line_type': 'straight'}
+    ]
+
+
+@pytest.fixture(scope="module")
+def hex_at_5_5():
+    """Vertices of a 1" flat-to-flat hexagon centered at (5, 5)."""
+    return calculate_hexagon_vertices(5.0, 5.0, 1.0)
+
+
 class TestUnits:
     """Tests for unit conversion utilities."""
 
@@ -90,7 +109,7 @@ class TestUnits:
         """Test that conversion round-trips correctly."""
         original = 3.14159
         converted = mm_to_inches(inches_to_mm(original))
-        assert abs(converted - original) < 1e-10
+        assert converted == pytest.approx(original, abs=1e-10)
 
 
 class TestMultipass:
@@ -119,15 +138,14 @@ class TestMultipass:
         """Test cumulative depth calculation."""
         depths = calculate_pass_depths(0.1, 0.05)
         assert len(depths) == 2
-        assert abs(depths[0] - 0.05) < 1e-10
-        assert abs(depths[1] - 0.1) < 1e-10
+        assert depths == pytest.approx((0.05, 0.1), abs=1e-10)
 
     def test_calculate_pass_depths_uneven(self):
         """Test evenly distributed depths when not exact multiple."""
         depths = calculate_pass_depths(0.125, 0.04)
         assert len(depths) == 4  # ceil(0.125/0.04) = 4
         # Each pass should be 0.03125
-        assert abs(depths[-1] - 0.125) < 1e-10  # Last depth is total
+        assert depths[-1] == pytest.approx(0.125, abs=1e-10)  # Last depth is total
 
 
 class TestToolCompensation:
@@ -144,38 +162,29 @@ class TestToolCompensation:
         """Test with zero tool diameter."""
         assert calculate_cut_radius(1.0, 0) == 0.5
 
-    def test_get_compensation_offset_none(self):
-        """Test compensation offset for 'none' - should be zero."""
-        assert get_compensation_offset(0.25, 'none') == 0.0
-        assert get_compensation_offset(0.125, 'none') == 0.0
-
-    def test_get_compensation_offset_interior(self):
-        """Test compensation offset for 'interior' - should be negative tool radius."""
-        assert get_compensation_offset(0.25, 'interior') == -0.125
-        assert get_compensation_offset(0.5, 'interior') == -0.25
-
-    def test_get_compensation_offset_exterior(self):
-        """Test compensation offset for 'exterior' - should be positive tool radius."""
-        assert get_compensation_offset(0.25, 'exterior') == 0.125
-        assert get_compensation_offset(0.5, 'exterior') == 0.25
-
-    def test_calculate_cut_radius_with_compensation_none(self):
-        """Test cut radius with 'none' compensation - tool center follows path."""
-        # 1" diameter, 0.25" tool, none = tool center follows 1" diameter
-        result = calculate_cut_radius(1.0, 0.25, 'none')
-        assert result == 0.5  # Just the feature radius
-
-    def test_calculate_cut_radius_with_compensation_interior(self):
-        """Test cut radius with 'interior' compensation - shrink by tool radius."""
-        # 1" diameter, 0.25" tool, interior = 0.5 - 0.125 = 0.375
-        result = calculate_cut_radius(1.0, 0.25, 'interior')
-        assert result == 0.375
-
-    def test_calculate_cut_radius_with_compensation_exterior(self):
-        """Test cut radius with 'exterior' compensation - expand by tool radius."""
-        # 1" diameter, 0.25" tool, exterior = 0.5 + 0.125 = 0.625
-        result = calculate_cut_radius(1.0, 0.25, 'exterior')
-        assert result == 0.625
+    @pytest.mark.parametrize("tool_diameter,compensation,expected", [
+        # 'none' - tool center follows the path, no offset
+        (0.25, 'none', 0.0),
+        (0.125, 'none', 0.0),
+        # 'interior' - negative tool radius
+        (0.25, 'interior', -0.125),
+        (0.5, 'interior', -0.25),
+        # 'exterior' - positive tool radius
+        (0.25, 'exterior', 0.125),
+        (0.5, 'exterior', 0.25),
+    ])
+    def test_get_compensation_offset(self, tool_diameter, compensation, expected):
+        """Test compensation offset for each compensation mode."""
+        assert get_compensation_offset(tool_diameter, compensation) == expected
+
+    @pytest.mark.parametrize("compensation,expected", [
+        ('none', 0.5),        # Just the feature radius
+        ('interior', 0.375),  # 0.5 - 0.125
+        ('exterior', 0.625),  # 0.5 + 0.125
+    ])
+    def test_calculate_cut_radius_with_compensation(self, compensation, expected):
+        """Test cut radius for a 1" feature and 0.25" tool in each mode."""
+        assert calculate_cut_radius(1.0, 0.25, compensation) == expected
 
     def test_calculate_cut_radius_default_is_interior(self):
         """Test that default compensation is 'interior' for backward compatibility."""
@@ -184,37 +193,27 @@ class TestToolCompensation:
         interior_result = calculate_cut_radius(1.0, 0.25, 'interior')
         assert default_result == interior_result
 
-    def test_calculate_hexagon_compensated_vertices_none(self):
+    def test_calculate_hexagon_compensated_vertices_none(self, hex_at_5_5):
         """Test hexagon vertices with 'none' compensation - no offset."""
-        regular = calculate_hexagon_vertices(5.0, 5.0, 1.0)
+        regular = hex_at_5_5
         compensated = calculate_hexagon_compensated_vertices(5.0, 5.0, 1.0, 0.125, 'none')
 
         # Vertices should be identical
         for reg, comp in zip(regular, compensated):
-            assert abs(reg[0] - comp[0]) < 1e-10
-            assert abs(reg[1] - comp[1]) < 1e-10
-
-    def test_calculate_hexagon_compensated_vertices_interior(self):
-        """Test hexagon vertices with 'interior' compensation - shrink toward center."""
-        regular = calculate_hexagon_vertices(5.0, 5.0, 1.0)
-        compensated = calculate_hexagon_compensated_vertices(5.0, 5.0, 1.0, 0.125, 'interior')
-
-        # Each compensated vertex should be closer to center
-        for reg, comp in zip(regular, compensated):
-            reg_dist = math.sqrt((reg[0] - 5.0)**2 + (reg[1] - 5.0)**2)
-            comp_dist = math.sqrt((comp[0] - 5.0)**2 + (comp[1] - 5.0)**2)
-            assert comp_dist < reg_dist
+            assert comp == pytest.approx(reg, abs=1e-10)
 
-    def test_calculate_hexagon_compensated_vertices_exterior(self):
-        """Test hexagon vertices with 'exterior' compensation - expand from center."""
-        regular = calculate_hexagon_vertices(5.0, 5.0, 1.0)
-        compensated = calculate_hexagon_compensated_vertices(5.0, 5.0, 1.0, 0.125, 'exterior')
+    @pytest.mark.parametrize("compensation,direction", [
+        ('interior', -1),  # Shrink toward center
+        ('exterior', 1),   # Expand from center
+    ])
+    def test_calculate_hexagon_compensated_vertices_offset(self, hex_at_5_5, compensation, direction):
+        """Test hexagon vertices move along the radius in the compensation direction."""
+        compensated = calculate_hexagon_compensated_vertices(5.0, 5.0, 1.0, 0.125, compensation)
 
-        # Each compensated vertex should be farther from center
-        for reg, comp in zip(regular, compensated):
+        for reg, comp in zip(hex_at_5_5, compensated):
             reg_dist = math.sqrt((reg[0] - 5.0)**2 + (reg[1] - 5.0)**2)
             comp_dist = math.sqrt((comp[0] - 5.0)**2 + (comp[1] - 5.0)**2)
-            assert comp_dist > reg_dist
+            assert (comp_dist - reg_dist) * direction > 0
 
     def test_calculate_hexagon_compensated_vertices_default_is_interior(self):
         """Test that default compensation is 'interior' for backward compatibility."""
@@ -222,39 +221,35 @@ class TestToolCompensation:
         interior_result = calculate_hexagon_compensated_vertices(5.0, 5.0, 1.0, 0.125, 'interior')
 
         for default_v, interior_v in zip(default_result, interior_result):
-            assert abs(default_v[0] - interior_v[0]) < 1e-10
-            assert abs(default_v[1] - interior_v[1]) < 1e-10
+            assert default_v == pytest.approx(interior_v, abs=1e-10)
 
     def test_offset_point_inward(self):
         """Test point offset toward center."""
         # Point at (2, 0) with center at (0, 0), offset by 0.5
         result = offset_point_inward((2, 0), (0, 0), 0.5)
-        assert abs(result[0] - 1.5) < 1e-10
-        assert abs(result[1] - 0) < 1e-10
+        assert result == pytest.approx((1.5, 0), abs=1e-10)
 
     def test_offset_point_inward_diagonal(self):
         """Test diagonal offset."""
         # Point at (1, 1) with center at (0, 0)
         result = offset_point_inward((1, 1), (0, 0), math.sqrt(2))
         # Should move to (0, 0)
-        assert abs(result[0]) < 1e-10
-        assert abs(result[1]) < 1e-10
+        assert result == pytest.approx((0, 0), abs=1e-10)
 
-    def test_calculate_hexagon_vertices_count(self):
+    def test_calculate_hexagon_vertices_count(self, hex_at_5_5):
         """Test that hexagon has 6 vertices."""
-        vertices = calculate_hexagon_vertices(5.0, 5.0, 1.0)
-        assert len(vertices) == 6
+        assert len(hex_at_5_5) == 6
 
     def test_calculate_hexagon_vertices_symmetry(self):
         """Test hexagon vertex symmetry."""
         vertices = calculate_hexagon_vertices(0, 0, 1.0)
         # Top and bottom should be on Y axis
-        assert abs(vertices[0][0]) < 1e-10  # Top vertex X = 0
-        assert abs(vertices[3][0]) < 1e-10  # Bottom vertex X = 0
+        assert vertices[0][0] == pytest.approx(0, abs=1e-10)  # Top vertex X = 0
+        assert vertices[3][0] == pytest.approx(0, abs=1e-10)  # Bottom vertex X = 0
 
-    def test_calculate_hexagon_compensated_vertices(self):
+    def test_calculate_hexagon_compensated_vertices(self, hex_at_5_5):
         """Test that compensated vertices are closer to center."""
-        regular = calculate_hexagon_vertices(5.0, 5.0, 1.0)
+        regular = hex_at_5_5
         compensated = calculate_hexagon_compensated_vertices(5.0, 5.0, 1.0, 0.125)
 
         # Each compensated vertex should be closer to center
@@ -267,15 +262,21 @@ class TestToolCompensation:
         """Test normal calculation for horizontal line."""
         # Line from (0, 0) to (1, 0) - normal should point up (0, 1)
         nx, ny = calculate_line_normal((0, 0), (1, 0))
-        assert abs(nx - 0.0) < 1e-10
-        assert abs(ny - 1.0) < 1e-10
+        assert (nx, ny) == pytest.approx((0.0, 1.0), abs=1e-10)
 
     def test_calculate_line_normal_vertical(self):
         """Test normal calculation for vertical line."""
         # Line from (0, 0) to (0, 1) - normal should point left (-1, 0)
         nx, ny = calculate_line_normal((0, 0), (0, 1))
-        assert abs(nx - (-1.0)) < 1e-10
-        assert abs(ny - 0.0) < 1e-10
+        assert (nx, ny) == pytest.approx((-1.0, 0.0), abs=1e-10)
+
+    def test_calculate_line_normal_reversed_axes(self):
+        """Test normal calculation for leftward and downward lines."""
+        # Leftward line - normal points down; downward line - normal points right
+        assert calculate_line_normal((1, 0), (0, 0)) == (0.0, -1.0)
+        assert calculate_line_normal((0, 1), (0, 0)) == (1.0, 0.0)
+        # Degenerate segment has no normal
+        assert calculate_line_normal((2, 3), (2, 3)) == (0.0, 0.0)
 
     def test_calculate_line_normal_diagonal(self):
         """Test normal calculation for diagonal line."""
@@ -283,35 +284,30 @@ class TestToolCompensation:
         nx, ny = calculate_line_normal((0, 0), (1, 1))
         # Normal should be perpendicular, unit length
         length = math.sqrt(nx * nx + ny * ny)
-        assert abs(length - 1.0) < 1e-10
+        assert length == pytest.approx(1.0, abs=1e-10)
         # Dot product with direction should be zero
         dot = nx * 1 + ny * 1  # dot with (1, 1) direction
         # Not directly zero because (1,1) is not unit length
         # But nx, ny should be (-1/sqrt(2), 1/sqrt(2))
         expected_nx = -1 / math.sqrt(2)
         expected_ny = 1 / math.sqrt(2)
-        assert abs(nx - expected_nx) < 1e-10
-        assert abs(ny - expected_ny) < 1e-10
+        assert (nx, ny) == pytest.approx((expected_nx, expected_ny), abs=1e-10)
 
     def test_offset_line_segment_positive(self):
         """Test segment offset with positive offset (left)."""
         # Horizontal line from (0, 0) to (1, 0), offset by 0.5 to the left
         new_p1, new_p2 = offset_line_segment((0, 0), (1, 0), 0.5)
         # Should move up to Y = 0.5
-        assert abs(new_p1[0] - 0.0) < 1e-10
-        assert abs(new_p1[1] - 0.5) < 1e-10
-        assert abs(new_p2[0] - 1.0) < 1e-10
-        assert abs(new_p2[1] - 0.5) < 1e-10
+        assert new_p1 == pytest.approx((0.0, 0.5), abs=1e-10)
+        assert new_p2 == pytest.approx((1.0, 0.5), abs=1e-10)
 
     def test_offset_line_segment_negative(self):
         """Test segment offset with negative offset (right)."""
         # Horizontal line from (0, 0) to (1, 0), offset by -0.5 to the right
         new_p1, new_p2 = offset_line_segment((0, 0), (1, 0), -0.5)
         # Should move down to Y = -0.5
-        assert abs(new_p1[0] - 0.0) < 1e-10
-        assert abs(new_p1[1] - (-0.5)) < 1e-10
-        assert abs(new_p2[0] - 1.0) < 1e-10
-        assert abs(new_p2[1] - (-0.5)) < 1e-10
+        assert new_p1 == pytest.approx((0.0, -0.5), abs=1e-10)
+        assert new_p2 == pytest.approx((1.0, -0.5), abs=1e-10)
 
     def test_calculate_line_intersection_perpendicular(self):
         """Test intersection of perpendicular lines."""
@@ -319,8 +315,7 @@ class TestToolCompensation:
         # Line 2: vertical through x=2
         result = calculate_line_intersection((0, 1), (5, 1), (2, 0), (2, 5))
         assert result is not None
-        assert abs(result[0] - 2.0) < 1e-10
-        assert abs(result[1] - 1.0) < 1e-10
+        assert result == pytest.approx((2.0, 1.0), abs=1e-10)
 
     def test_calculate_line_intersection_parallel(self):
         """Test that parallel lines return None."""
@@ -334,8 +329,7 @@ class TestToolCompensation:
         # Line through (1, 0) at -45 degrees
         result = calculate_line_intersection((0, 0), (1, 1), (1, 0), (0, 1))
         assert result is not None
-        assert abs(result[0] - 0.5) < 1e-10
-        assert abs(result[1] - 0.5) < 1e-10
+        assert result == pytest.approx((0.5, 0.5), abs=1e-10)
 
     def test_calculate_path_winding_ccw_square(self):
         """Test winding for CCW square."""
@@ -373,18 +367,10 @@ class TestToolCompensation:
         result = compensate_line_path(path, 0.125, 'none')
         assert result == path
 
-    def test_compensate_rectangle_exterior(self):
+    def test_compensate_rectangle_exterior(self, ccw_unit_square):
         """Test exterior compensation expands rectangle outward."""
-        # 1x1 square at origin, CCW - explicit closing point
-        path = [
-            {'x': 0, 'y': 0, 'line_type': 'start'},
-            {'x': 1, 'y': 0, 'line_type': 'straight'},
-            {'x': 1, 'y': 1, 'line_type': 'straight'},
-            {'x': 0, 'y': 1, 'line_type': 'straight'},
-            {'x': 0, 'y': 0, 'line_type': 'straight'}
-        ]
         tool_diameter = 0.25  # 0.125 radius
-        result = compensate_line_path(path, tool_diameter, 'exterior')
+        result = compensate_line_path(ccw_unit_square, tool_diameter, 'exterior')
 
         # All points should move outward (exterior = expand)
         # For a CCW path, exterior means offset left = positive offset
@@ -401,18 +387,10 @@ class TestToolCompensation:
         assert result[3]['x'] < 0
         assert result[3]['y'] > 1
 
-    def test_compensate_rectangle_interior(self):
+    def test_compensate_rectangle_interior(self, ccw_unit_square):
         """Test interior compensation shrinks rectangle inward."""
-        # 1x1 square at origin, CCW - explicit closing point
-        path = [
-            {'x': 0, 'y': 0, 'line_type': 'start'},
-            {'x': 1, 'y': 0, 'line_type': 'straight'},
-            {'x': 1, 'y': 1, 'line_type': 'straight'},
-            {'x': 0, 'y': 1, 'line_type': 'straight'},
-            {'x': 0, 'y': 0, 'line_type': 'straight'}
-        ]
         tool_diameter = 0.25  # 0.125 radius
-        result = compensate_line_path(path, tool_diameter, 'interior')
+        result = compensate_line_path(ccw_unit_square, tool_diameter, 'interior')
 
         # All points should move inward (interior = shrink)
         # Corner at (0,0) should move to approx (0.125, 0.125)
@@ -681,16 +659,18 @@ class TestArcUtils:
         direction = calculate_arc_direction((1, 16), (3, 16), (2, 16))
         assert direction == "G02"
 
-    def test_calculate_arc_direction_semicircle_ccw_hint(self):
-        """Test semicircle with CCW hint returns G03."""
-        # Same semicircle, but with CCW hint to curve upward
-        direction = calculate_arc_direction((1, 16), (3, 16), (2, 16), 'ccw')
-        assert direction == "G03"
-
-    def test_calculate_arc_direction_semicircle_cw_hint(self):
-        """Test semicircle with CW hint returns G02."""
-        direction = calculate_arc_direction((1, 16), (3, 16), (2, 16), 'cw')
-        assert direction == "G02"
+    @pytest.mark.parametrize("hint,expected", [
+        ('ccw', "G03"),  # CCW hint curves the semicircle upward
+        ('cw', "G02"),
+        # Hints are case insensitive
+        ('CCW', "G03"),
+        ('Ccw', "G03"),
+        ('CW', "G02"),
+        ('Cw', "G02"),
+    ])
+    def test_calculate_arc_direction_semicircle_hint(self, hint, expected):
+        """Test semicircle direction follows the direction hint."""
+        assert calculate_arc_direction((1, 16), (3, 16), (2, 16), hint) == expected
 
     def test_calculate_arc_direction_hint_overrides_auto(self):
         """Test that direction hint overrides automatic detection."""
@@ -702,24 +682,12 @@ class TestArcUtils:
         forced_direction = calculate_arc_direction((1, 0), (0, 1), (0, 0), 'cw')
         assert forced_direction == "G02"
 
-    def test_calculate_arc_direction_hint_case_insensitive(self):
-        """Test that direction hint is case insensitive."""
-        assert calculate_arc_direction((1, 16), (3, 16), (2, 16), 'CCW') == "G03"
-        assert calculate_arc_direction((1, 16), (3, 16), (2, 16), 'Ccw') == "G03"
-        assert calculate_arc_direction((1, 16), (3, 16), (2, 16), 'CW') == "G02"
-        assert calculate_arc_direction((1, 16), (3, 16), (2, 16), 'Cw') == "G02"
-
-    def test_calculate_arc_direction_invalid_hint_falls_through(self):
-        """Test that invalid hint falls through to auto-detection."""
-        # Invalid hint should be ignored, fall through to auto-detect
-        direction = calculate_arc_direction((1, 0), (0, 1), (0, 0), 'invalid')
+    @pytest.mark.parametrize("hint", ['invalid', None])
+    def test_calculate_arc_direction_unusable_hint_falls_through(self, hint):
+        """Test that an invalid or None hint falls through to auto-detection."""
+        direction = calculate_arc_direction((1, 0), (0, 1), (0, 0), hint)
         assert direction == "G03"  # Natural CCW arc
 
-    def test_calculate_arc_direction_none_hint(self):
-        """Test that None hint uses auto-detection."""
-        direction = calculate_arc_direction((1, 0), (0, 1), (0, 0), None)
-        assert direction == "G03"
-
     def test_calculate_ij_offsets(self):
         """Test I, J offset calculation."""
         # From (3, 0) to center at (0, 0)
@@ -825,6 +793,10 @@ class TestGCodeFormat:
         """Test that hyphens are preserved."""
         assert sanitize_project_name("Frame-16in") == "Frame-16in"
 
+    def test_sanitize_project_name_drops_non_ascii(self):
+        """Test that non-ASCII letters are removed like other special characters."""
+        assert sanitize_project_name("Café Plate") == "Caf_Plate"
+
 
 class TestSubroutineGenerator:
     """Tests for subroutine generation utilities."""
@@ -988,6 +960,26 @@ class TestValidators:
         assert len(warnings) == 1
         assert "missing center" in warnings[0]
 
+    def test_validate_operations_structure_valid(self):
+        """Test well-formed operations pass, including missing keys."""
+        operations = {
+            'drill_holes': [{'id': 'h1', 'type': 'single', 'x': 1.0, 'y': 1.0}],
+            'circular_cuts': []
+        }
+        assert validate_operations_structure(operations) == []
+
+    def test_validate_operations_structure_invalid(self):
+        """Test malformed operations are reported."""
+        assert validate_operations_structure([]) == ["Operations must be an object"]
+
+        errors = validate_operations_structure({
+            'drill_holes': {'id': 'h1'},
+            'line_cuts': ['not-a-dict']
+        })
+        assert len(errors) == 2
+        assert "'drill_holes' must be a list" in errors[0]
+        assert "'line_cuts' must contain only objects" in errors[1]
+
     def test_validate_arc_geometry_no_arcs(self):
         """Test path with no arcs returns no warnings."""
         path = [
@@ -1035,14 +1027,12 @@ class TestLeadIn:
         lead_in_x, lead_in_y = calculate_circle_lead_in_point(5.0, 5.0, 0.5, 0.25)
         # Profile start is at (5.5, 5) - 3 o'clock
         # Lead-in is 0.25 further out: (5.75, 5)
-        assert abs(lead_in_x - 5.75) < 1e-10
-        assert abs(lead_in_y - 5.0) < 1e-10
+        assert (lead_in_x, lead_in_y) == pytest.approx((5.75, 5.0), abs=1e-10)
 
     def test_calculate_circle_lead_in_point_zero_distance(self):
         """Test lead-in with zero distance returns profile start."""
         lead_in_x, lead_in_y = calculate_circle_lead_in_point(5.0, 5.0, 0.5, 0)
-        assert abs(lead_in_x - 5.5) < 1e-10
-        assert abs(lead_in_y - 5.0) < 1e-10
+        assert (lead_in_x, lead_in_y) == pytest.approx((5.5, 5.0), abs=1e-10)
 
     def test_calculate_hexagon_lead_in_point(self):
         """Test lead-in point for hexagon extends first edge backwards."""
@@ -1068,8 +1058,7 @@ class TestLeadIn:
         """Test lead-in with single vertex returns that vertex."""
         vertices = [(5.0, 5.0)]
         lead_in_x, lead_in_y = calculate_hexagon_lead_in_point(vertices, 0.25)
-        assert abs(lead_in_x - 5.0) < 1e-10
-        assert abs(lead_in_y - 5.0) < 1e-10
+        assert (lead_in_x, lead_in_y) == pytest.approx((5.0, 5.0), abs=1e-10)
 
     def test_calculate_line_lead_in_point(self):
         """Test lead-in point for line extends initial direction backwards."""
@@ -1080,8 +1069,7 @@ class TestLeadIn:
         ]
         lead_in_x, lead_in_y = calculate_line_lead_in_point(path, 0.25)
         # Lead-in should be 0.25 to the left of start: (0.75, 1)
-        assert abs(lead_in_x - 0.75) < 1e-10
-        assert abs(lead_in_y - 1.0) < 1e-10
+        assert (lead_in_x, lead_in_y) == pytest.approx((0.75, 1.0), abs=1e-10)
 
     def test_calculate_line_lead_in_point_diagonal(self):
         """Test lead-in for diagonal line."""
@@ -1092,15 +1080,13 @@ class TestLeadIn:
         ]
         lead_in_x, lead_in_y = calculate_line_lead_in_point(path, math.sqrt(2) / 2)
         # Lead-in should be 0.5 in both X and Y negative direction
-        assert abs(lead_in_x - (-0.5)) < 1e-10
-        assert abs(lead_in_y - (-0.5)) < 1e-10
+        assert (lead_in_x, lead_in_y) == pytest.approx((-0.5, -0.5), abs=1e-10)
 
     def test_calculate_line_lead_in_point_single_point(self):
         """Test lead-in with single point returns that point."""
         path = [{'x': 1, 'y': 1}]
         lead_in_x, lead_in_y = calculate_line_lead_in_point(path, 0.25)
-        assert abs(lead_in_x - 1.0) < 1e-10
-        assert abs(lead_in_y - 1.0) < 1e-10
+        assert (lead_in_x, lead_in_y) == pytest.approx((1.0, 1.0), abs=1e-10)
 
     def test_calculate_line_lead_in_point_empty(self):
         """Test lead-in with empty path returns origin."""
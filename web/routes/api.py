@@ -19,7 +19,10 @@ def save_project(project_id):
     if not data:
         return error_response('No data provided')
 
-    project = ProjectService.save(project_id, data)
+    try:
+        project = ProjectService.save(project_id, data)
+    except ValueError as e:
+        return error_response(str(e))
     if not project:
         return error_response('Project not found', 404)
 
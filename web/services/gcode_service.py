@@ -81,6 +81,19 @@ class GCodeService:
         """
         Validate a project configuration before generating G-code.
 
+        Returns list of error messages (empty if valid).
+        """
+        expanded = expand_all_operations(project.operations or {})
+        return GCodeService._validate_expanded(project, expanded)
+
+    @staticmethod
+    def _validate_expanded(project: Project, expanded: Dict) -> List[str]:
+        """
+        Validate a project against already-expanded operations.
+
+        Lets generation reuse a single expansion for both the bounds checks
+        and G-code emission.
+
         Returns list of error messages (empty if valid).
         """
         errors = []
@@ -130,8 +143,6 @@ class GCodeService:
             errors.append("Project has no operations")
 
         # Validate coordinates are within machine bounds
-        expanded = expand_all_operations(operations)
-
         max_x = machine.max_x
         max_y = machine.max_y
         general = SettingsService.get_general_settings()
@@ -404,23 +415,35 @@ class GCodeService:
 
         Returns expanded operations dict ready for generation.
         """
-        material = project.material
-        drill_tool = project.drill_tool if project.project_type == 'drill' else None
-        end_mill_tool = project.end_mill_tool if project.project_type != 'drill' else None
-
         # Expand operations
         expanded = expand_all_operations(project.operations or {})
 
-        # Filter for tube void if applicable
-        if material and material.form == 'tube' and project.tube_void_skip:
-            drill_diameter = drill_tool.size if drill_tool else None
-            end_mill_diameter = end_mill_tool.size if end_mill_tool else None
+        return GCodeService._apply_void_skip(project, expanded)
 
-            expanded = filter_operations_for_tube(
-                expanded, material, drill_diameter, end_mill_diameter
-            )
+    @staticmethod
+    def _apply_void_skip(project: Project, expanded: Dict) -> Dict:
+        """
+        Drop expanded operations that fall inside a tube's hollow center.
 
-        return expanded
+        A tube has exactly one rectangular void, so each feature is tested
+        against a single precomputed bounds tuple - one pass over the
+        expanded operations with no spatial index needed.
+
+        Returns the expanded operations unchanged for sheet stock or when
+        tube_void_skip is disabled.
+        """
+        material = project.material
+        if not (material and material.form == 'tube' and project.tube_void_skip):
+            return expanded
+
+        drill_tool = project.drill_tool if project.project_type == 'drill' else None
+        end_mill_tool = project.end_mill_tool if project.project_type != 'drill' else None
+        drill_diameter = drill_tool.size if drill_tool else None
+        end_mill_diameter = end_mill_tool.size if end_mill_tool else None
+
+        return filter_operations_for_tube(
+            expanded, material, drill_diameter, end_mill_diameter
+        )
 
     @staticmethod
     def generate_with_params(
@@ -446,9 +469,12 @@ class GCodeService:
 
         Returns GenerationResult with main_gcode, subroutines dict, and warnings.
         """
+        # Expand once and share the result between validation and generation
+        expanded = expand_all_operations(project.operations or {})
+
         # Validate first (unless skipped)
         if not skip_validation:
-            errors = GCodeService.validate(project)
+            errors = GCodeService._validate_expanded(project, expanded)
             if errors:
                 raise ValueError(f"Project validation failed: {'; '.join(errors)}")
 
@@ -491,8 +517,8 @@ class GCodeService:
         if not drill_params and not cut_params:
             raise ValueError("No G-code parameters provided or found for tool/material")
 
-        # Prepare operations
-        expanded = GCodeService.prepare_operations(project)
+        # Filter tube void operations
+        expanded = GCodeService._apply_void_skip(project, expanded)
 
         # Create generator with optional name suffix
         project_name = project.name + project_name_suffix
@@ -2,6 +2,7 @@
 import math
 from typing import Dict, List, Optional, Tuple
 
+from src.hexagon_generator import HEX_UNIT_VECTORS
 from src.utils.tool_compensation import (
     calculate_cut_radius,
     calculate_hexagon_compensated_vertices,
@@ -301,10 +302,9 @@ class PreviewService:
 
             # Feature geometry
             points = []
-            for i in range(6):
-                angle = math.pi / 2 - i * math.pi / 3
-                px = cx + circumradius * math.cos(angle)
-                py = cy - circumradius * math.sin(angle)
+            for ux, uy in HEX_UNIT_VECTORS:
+                px = cx + circumradius * ux
+                py = cy - circumradius * uy
                 points.append(f"{px},{py}")
             svg_parts.append(
                 f'<polygon points="{" ".join(points)}" fill="none" stroke="{Colors.HEXAGON}" stroke-width="2"/>'
@@ -338,7 +338,7 @@ class PreviewService:
                 coord_labels.append((cx, cy + circumradius + 14, f'({h["center_x"]:.3f}, {h["center_y"]:.3f}) ftf={h["flat_to_flat"]:.3f}', Colors.HEXAGON))
             elif coords_mode == 'toolpath':
                 if comp_vertices is not None:
-                    comp_apothem = math.sqrt((comp_vertices[0][0] - h['center_x'])**2 + (comp_vertices[0][1] - h['center_y'])**2) * math.cos(math.pi / 6)
+                    comp_apothem = math.hypot(comp_vertices[0][0] - h['center_x'], comp_vertices[0][1] - h['center_y']) * math.cos(math.pi / 6)
                     comp_ftf = comp_apothem * 2
                     coord_labels.append((cx, cy + circumradius + 14, f'({h["center_x"]:.3f}, {h["center_y"]:.3f}) ftf={comp_ftf:.3f}', Colors.HEXAGON))
                 else:
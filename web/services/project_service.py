@@ -5,6 +5,7 @@ import uuid
 
 from web.extensions import db
 from web.models import Project
+from src.utils.validators import validate_operations_structure
 
 
 # Empty operations structure
@@ -72,11 +73,20 @@ class ProjectService:
 
     @staticmethod
     def save(project_id: str, data: Dict) -> Optional[Project]:
-        """Update a project from editor data."""
+        """
+        Update a project from editor data.
+
+        Raises ValueError if the operations payload is malformed.
+        """
         project = Project.query.get(project_id)
         if not project:
             return None
 
+        if 'operations' in data:
+            errors = validate_operations_structure(data['operations'])
+            if errors:
+                raise ValueError('; '.join(errors))
+
         if 'name' in data:
             project.name = data['name']
         if 'project_type' in data: